@@ -1,5 +1,21 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from pyquil._version import pyquil_version
 from pyquil.quil import Program
-from pyquil.api import list_quantum_computers, get_qc
+
+if TYPE_CHECKING:
+    from pyquil import api
+    from pyquil.api import list_quantum_computers, get_qc
 
 __version__ = pyquil_version
+
+
+def __getattr__(name: str) -> Any:
+    # ``get_qc`` and ``list_quantum_computers`` (and the ``api`` sub-package they live in) are loaded on first
+    # access, so that ``import pyquil`` does not pay for the network clients and their dependencies up front.
+    if name == "api":
+        return importlib.import_module("pyquil.api")
+    if name in ("get_qc", "list_quantum_computers"):
+        return getattr(importlib.import_module("pyquil.api"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,7 +13,9 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
+import re
 import sys
+from typing import Tuple
 
 if sys.version_info < (3, 8):
     from importlib_metadata import version
@@ -21,3 +23,20 @@ else:
     from importlib.metadata import version
 
 pyquil_version = version(__package__)  # type: ignore
+
+
+_VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+
+def parse_version(version: str, component: str) -> Tuple[int, int, int]:
+    """
+    Parse the major, minor and patch components of a version string such as ``1.23.0``.
+
+    :param version: The version string reported by ``component``.
+    :param component: The name of the versioned component, e.g. ``quilc``, used in error messages.
+    """
+    match = _VERSION_PATTERN.match(version)
+    if match is None:
+        raise ValueError(f"Unable to parse {component} version {version}.")
+    major, minor, patch = match.groups()
+    return int(major), int(minor), int(patch)
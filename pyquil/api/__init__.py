@@ -15,7 +15,12 @@
 ##############################################################################
 """
 Sub-package for facilitating connections to the QVM / QPU.
+
+The public names below are imported lazily on first access, so that importing this package does not pull in the
+network clients and their dependencies until they are actually used.
 """
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 __all__ = [
     "AbstractCompiler",
@@ -38,19 +43,54 @@ __all__ = [
     "WavefunctionSimulator",
 ]
 
-from qcs_api_client.client import QCSClientConfiguration
-
-from pyquil.api._benchmark import BenchmarkConnection
-from pyquil.api._compiler import QVMCompiler, QPUCompiler, QuantumExecutable, EncryptedProgram, AbstractCompiler
-from pyquil.api._engagement_manager import EngagementManager
-from pyquil.api._qam import QAM, QAMExecutionResult
-from pyquil.api._qpu import QPU
-from pyquil.api._quantum_computer import (
-    QuantumComputer,
-    list_quantum_computers,
-    get_qc,
-    local_forest_runtime,
-)
-from pyquil.api._qvm import QVM
-from pyquil.api._wavefunction_simulator import WavefunctionSimulator
-from pyquil.quantum_processor import QCSQuantumProcessor
+if TYPE_CHECKING:
+    from qcs_api_client.client import QCSClientConfiguration
+
+    from pyquil.api._benchmark import BenchmarkConnection
+    from pyquil.api._compiler import QVMCompiler, QPUCompiler, QuantumExecutable, EncryptedProgram, AbstractCompiler
+    from pyquil.api._engagement_manager import EngagementManager
+    from pyquil.api._qam import QAM, QAMExecutionResult
+    from pyquil.api._qpu import QPU
+    from pyquil.api._quantum_computer import (
+        QuantumComputer,
+        list_quantum_computers,
+        get_qc,
+        local_forest_runtime,
+    )
+    from pyquil.api._qvm import QVM
+    from pyquil.api._wavefunction_simulator import WavefunctionSimulator
+    from pyquil.quantum_processor import QCSQuantumProcessor
+
+_LAZY_ATTRIBUTES = {
+    "AbstractCompiler": "pyquil.api._compiler",
+    "BenchmarkConnection": "pyquil.api._benchmark",
+    "EncryptedProgram": "pyquil.api._compiler",
+    "EngagementManager": "pyquil.api._engagement_manager",
+    "get_qc": "pyquil.api._quantum_computer",
+    "list_quantum_computers": "pyquil.api._quantum_computer",
+    "local_forest_runtime": "pyquil.api._quantum_computer",
+    "QAM": "pyquil.api._qam",
+    "QAMExecutionResult": "pyquil.api._qam",
+    "QCSClientConfiguration": "qcs_api_client.client",
+    "QCSQuantumProcessor": "pyquil.quantum_processor",
+    "QPU": "pyquil.api._qpu",
+    "QPUCompiler": "pyquil.api._compiler",
+    "QuantumComputer": "pyquil.api._quantum_computer",
+    "QuantumExecutable": "pyquil.api._compiler",
+    "QVM": "pyquil.api._qvm",
+    "QVMCompiler": "pyquil.api._compiler",
+    "WavefunctionSimulator": "pyquil.api._wavefunction_simulator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
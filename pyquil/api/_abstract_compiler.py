@@ -16,12 +16,23 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import dataclasses
-from typing import Any, Dict, List, Optional, Sequence, Union
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from pyquil._memory import Memory
-from pyquil._version import pyquil_version
-from pyquil.api._compiler_client import CompilerClient, CompileToNativeQuilRequest
-from pyquil.external.rpcq import compiler_isa_to_target_quantum_processor
+from pyquil._version import parse_version, pyquil_version
+from pyquil.api._compiler_client import (
+    CompilerClient,
+    CompileToNativeQuilRequest,
+    CompileToNativeQuilResponse,
+    NativeQuilMetadataResponse,
+)
+from pyquil.api._disk_cache import cache_path, read_entry, write_entry
+from pyquil.external.rpcq import TargetQuantumProcessor, compiler_isa_to_target_quantum_processor
 from pyquil.parser import parse_program
 from pyquil.paulis import PauliTerm
 from pyquil.quantum_processor import AbstractQuantumProcessor
@@ -31,6 +42,8 @@ from pyquil.quilbase import Gate
 from qcs_api_client.client import QCSClientConfiguration
 from rpcq.messages import NativeQuilMetadata, ParameterAref, ParameterSpec
 
+_log = logging.getLogger(__name__)
+
 
 class QuilcVersionMismatch(Exception):
     pass
@@ -81,6 +94,13 @@ class EncryptedProgram:
 QuantumExecutable = Union[EncryptedProgram, Program]
 
 
+_NATIVE_QUIL_CACHE_SIZE = 128
+"""Number of compiled programs each compiler keeps for reuse by ``quil_to_native_quil``."""
+
+_NATIVE_QUIL_DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+"""Size above which the oldest on-disk native Quil entries are evicted."""
+
+
 class AbstractCompiler(ABC):
     """The abstract interface for a compiler."""
 
@@ -96,6 +116,11 @@ class AbstractCompiler(ABC):
 
         self._client_configuration = client_configuration or QCSClientConfiguration.load()
         self._compiler_client = CompilerClient(client_configuration=self._client_configuration, request_timeout=timeout)
+        self._target_quantum_processor: Optional[Tuple[AbstractQuantumProcessor, TargetQuantumProcessor]] = None
+        self._target_quantum_processor_key: Optional[str] = None
+        self._quilc_version: Optional[str] = None
+        self._native_quil_cache: "OrderedDict[Tuple[str, Optional[bool]], CompileToNativeQuilResponse]" = OrderedDict()
+        self._native_quil_cache_lock = threading.Lock()
 
     def get_version_info(self) -> Dict[str, Any]:
         """
@@ -109,25 +134,56 @@ class AbstractCompiler(ABC):
         """
         Compile an arbitrary quil program according to the ISA of ``self.quantum_processor``.
 
+        The quilc target derived from ``self.quantum_processor`` is built once and reused until the quantum processor
+        is replaced. If the quantum processor is modified in place (e.g. the topology of an ``NxQuantumProcessor``),
+        call ``reset()`` so that the change is picked up.
+
+        Recently compiled programs are remembered, so compiling a program whose Quil is unchanged does not make
+        another request to quilc. Use ``reset()`` to discard them. If the ``PYQUIL_NATIVE_QUIL_CACHE`` environment
+        variable is set to ``1``, compiled programs are also persisted to disk (under
+        ``$XDG_CACHE_HOME/pyquil/native_quil``, defaulting to ``~/.cache``) for reuse by later processes running the
+        same pyQuil and quilc versions.
+
         :param program: Arbitrary quil to compile
         :param protoquil: Whether to restrict to protoquil (``None`` means defer to server)
         :return: Native quil and compiler metadata
         """
-        self._connect()
-        compiler_isa = self.quantum_processor.to_compiler_isa()
-        request = CompileToNativeQuilRequest(
-            program=program.out(calibrations=False),
-            target_quantum_processor=compiler_isa_to_target_quantum_processor(compiler_isa),
-            protoquil=protoquil,
-        )
-        response = self._compiler_client.compile_to_native_quil(request)
+        target_quantum_processor = self._get_target_quantum_processor()
+        cache_key = (program.out(calibrations=False), protoquil)
+        response = self._get_cached_native_quil(cache_key)
+        if response is None:
+            quilc_version = self._connect()
+            disk_cache_path = None
+            if os.getenv("PYQUIL_NATIVE_QUIL_CACHE") == "1":
+                # Entries are only reused by the same pyQuil and quilc versions, for the same target
+                disk_cache_path = cache_path(
+                    "native_quil",
+                    pyquil_version,
+                    quilc_version,
+                    self._get_target_quantum_processor_key(),
+                    str(protoquil),
+                    cache_key[0],
+                    suffix=".json",
+                )
+                response = _read_native_quil(disk_cache_path)
+            if response is None:
+                request = CompileToNativeQuilRequest(
+                    program=cache_key[0],
+                    target_quantum_processor=target_quantum_processor,
+                    protoquil=protoquil,
+                )
+                response = self._compiler_client.compile_to_native_quil(request)
+                if disk_cache_path is not None:
+                    _write_native_quil(disk_cache_path, response)
+            self._cache_native_quil(cache_key, response)
 
         nq_program = parse_program(response.native_program)
         nq_program.native_quil_metadata = (
             None
             if response.metadata is None
             else NativeQuilMetadata(
-                final_rewiring=response.metadata.final_rewiring,
+                # Responses are cached and shared between calls, so don't hand out the cached list
+                final_rewiring=list(response.metadata.final_rewiring),
                 gate_depth=response.metadata.gate_depth,
                 gate_volume=response.metadata.gate_volume,
                 multiqubit_gate_depth=response.metadata.multiqubit_gate_depth,
@@ -142,15 +198,63 @@ class AbstractCompiler(ABC):
         nq_program._memory = program._memory.copy()
         return nq_program
 
-    def _connect(self) -> None:
+    def _get_target_quantum_processor(self) -> TargetQuantumProcessor:
+        # Converting the ISA is costly for large processors, so reuse the conversion until the
+        # quantum processor is replaced or the compiler is reset. In-place changes to the processor
+        # are not detected; callers must reset() after making them.
+        quantum_processor = self.quantum_processor
+        if self._target_quantum_processor is None or self._target_quantum_processor[0] is not quantum_processor:
+            compiler_isa = quantum_processor.to_compiler_isa()
+            self._target_quantum_processor = (
+                quantum_processor,
+                compiler_isa_to_target_quantum_processor(compiler_isa),
+            )
+            self._target_quantum_processor_key = None
+            # Programs compiled for a different target must not be reused
+            with self._native_quil_cache_lock:
+                self._native_quil_cache.clear()
+        return self._target_quantum_processor[1]
+
+    def _get_target_quantum_processor_key(self) -> str:
+        # A stable serialization of the target, so that on-disk compilations are only reused for the same ISA
+        if self._target_quantum_processor_key is None:
+            target = self._get_target_quantum_processor().asdict()  # type: ignore
+            self._target_quantum_processor_key = json.dumps(target, sort_keys=True, default=str)
+        return self._target_quantum_processor_key
+
+    def _get_cached_native_quil(self, key: Tuple[str, Optional[bool]]) -> Optional[CompileToNativeQuilResponse]:
+        with self._native_quil_cache_lock:
+            response = self._native_quil_cache.get(key)
+            if response is not None:
+                self._native_quil_cache.move_to_end(key)
+            return response
+
+    def _cache_native_quil(self, key: Tuple[str, Optional[bool]], response: CompileToNativeQuilResponse) -> None:
+        with self._native_quil_cache_lock:
+            self._native_quil_cache[key] = response
+            self._native_quil_cache.move_to_end(key)
+            while len(self._native_quil_cache) > _NATIVE_QUIL_CACHE_SIZE:
+                self._native_quil_cache.popitem(last=False)
+
+    def _connect(self) -> str:
+        """
+        Check that quilc is reachable and compatible, returning its version.
+        """
+        # The quilc version is checked once per compiler (and again after a reset), rather than with an extra
+        # round trip before every compilation.
+        if self._quilc_version is not None:
+            return self._quilc_version
         try:
-            _check_quilc_version(self._compiler_client.get_version())
+            version = self._compiler_client.get_version()
+            _check_quilc_version(version)
         except TimeoutError:
             raise QuilcNotRunning(
                 f"Request to quilc at {self._compiler_client.base_url} timed out. "
                 "This could mean that quilc is not running, is not reachable, or is "
                 "responding slowly."
             )
+        self._quilc_version = version
+        return version
 
     @abstractmethod
     def native_quil_to_executable(self, nq_program: Program) -> QuantumExecutable:
@@ -164,8 +268,41 @@ class AbstractCompiler(ABC):
     def reset(self) -> None:
         """
         Reset the state of the this compiler.
+
+        This discards the cached quilc target and compiled programs, so it must be called after modifying
+        ``self.quantum_processor`` in place.
+        """
+        self._target_quantum_processor = None
+        self._quilc_version = None
+        with self._native_quil_cache_lock:
+            self._native_quil_cache.clear()
+        self.close()
+
+    def close(self) -> None:
         """
-        pass
+        Close any open connections to quilc. They are reopened on the next request.
+        """
+        self._compiler_client.close()
+
+
+def _read_native_quil(path: str) -> Optional[CompileToNativeQuilResponse]:
+    data = read_entry(path)
+    if data is None:
+        return None
+    try:
+        entry = json.loads(data)
+        metadata = entry["metadata"]
+        return CompileToNativeQuilResponse(
+            native_program=entry["native_program"],
+            metadata=None if metadata is None else NativeQuilMetadataResponse(**metadata),
+        )
+    except Exception as ex:
+        _log.debug(f"Ignoring unreadable native Quil cache entry {path}: {ex}")
+        return None
+
+
+def _write_native_quil(path: str, response: CompileToNativeQuilResponse) -> None:
+    write_entry(path, json.dumps(dataclasses.asdict(response)).encode(), max_bytes=_NATIVE_QUIL_DISK_CACHE_MAX_BYTES)
 
 
 def _check_quilc_version(version: str) -> None:
@@ -174,7 +311,7 @@ def _check_quilc_version(version: str) -> None:
 
     :param version: quilc version.
     """
-    major, minor, _ = map(int, version.split("."))
+    major, minor, _ = parse_version(version, "quilc")
     if major == 1 and minor < 8:
         raise QuilcVersionMismatch(
             "Must use quilc >= 1.8.0 with pyquil >= 2.8.0, but you " f"have quilc {version} and pyquil {pyquil_version}"
@@ -14,30 +14,40 @@
 #    limitations under the License.
 ##############################################################################
 import logging
+import os
+import pickle
+import re
 import threading
-from contextlib import contextmanager
-from typing import Dict, Optional, cast, List, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from typing import Dict, Optional, cast, List, Iterator, Sequence
 
 import httpx
 from qcs_api_client.client import QCSClientConfiguration
 from qcs_api_client.models.translate_native_quil_to_encrypted_binary_request import (
     TranslateNativeQuilToEncryptedBinaryRequest,
 )
+from qcs_api_client.models.translate_native_quil_to_encrypted_binary_response import (
+    TranslateNativeQuilToEncryptedBinaryResponse,
+)
 from qcs_api_client.operations.sync import (
     translate_native_quil_to_encrypted_binary,
     get_quilt_calibrations,
 )
 from qcs_api_client.types import UNSET
-from rpcq.messages import ParameterSpec
+from rpcq.messages import ParameterSpec, RewriteArithmeticResponse
 
+from pyquil._version import pyquil_version
 from pyquil.api._abstract_compiler import AbstractCompiler, QuantumExecutable, EncryptedProgram
+from pyquil.api._disk_cache import cache_path, read_entry, write_entry
 from pyquil.api._qcs_client import qcs_client
 from pyquil.api._rewrite_arithmetic import rewrite_arithmetic
 from pyquil.parser import parse_program, parse
 from pyquil.quantum_processor import AbstractQuantumProcessor
 from pyquil.quil import Program
 from pyquil.quilatom import MemoryReference, ExpressionDesignator
-from pyquil.quilbase import Declare, Gate
+from pyquil.quilbase import Gate
 
 _log = logging.getLogger(__name__)
 
@@ -46,17 +56,21 @@ class QPUCompilerNotRunning(Exception):
     pass
 
 
+_MEMORY_REFERENCE_PATTERN = re.compile(r"\s*([^\s\[\]]+)(?:\[\s*(\d+)\s*\])?\s*")
+
+
+@lru_cache(maxsize=4096)
 def parse_mref(val: str) -> MemoryReference:
-    """ Parse a memory reference from its string representation. """
-    val = val.strip()
-    try:
-        if val[-1] == "]":
-            name, offset = val.split("[")
-            return MemoryReference(name, int(offset[:-1]))
-        else:
-            return MemoryReference(val)
-    except Exception:
-        raise ValueError(f"Unable to parse memory reference {val}.")
+    """Parse a memory reference from its string representation.
+
+    Results are cached, so repeated translations of programs with the same readout registers share
+    MemoryReference instances; the returned reference must not be mutated.
+    """
+    match = _MEMORY_REFERENCE_PATTERN.fullmatch(val)
+    if match is None:
+        raise ValueError(f"Unable to parse memory reference {val.strip()}.")
+    name, offset = match.groups()
+    return MemoryReference(name) if offset is None else MemoryReference(name, int(offset))
 
 
 def _collect_memory_descriptors(program: Program) -> Dict[str, ParameterSpec]:
@@ -67,11 +81,48 @@ def _collect_memory_descriptors(program: Program) -> Dict[str, ParameterSpec]:
 
     return {
         instr.name: ParameterSpec(type=instr.memory_type, length=instr.memory_size)
-        for instr in program
-        if isinstance(instr, Declare)
+        for instr in program.declarations.values()
     }
 
 
+_CALIBRATION_DISK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+@lru_cache(maxsize=16)
+def _parse_calibration_program(quilt: str) -> Program:
+    """Parse a Quil-T calibration program.
+
+    Results are cached by program text so that compilers targeting the same quantum processor share one parse.
+    The cached Program must not be mutated; callers should work on a copy.
+
+    If the ``PYQUIL_CALIB_CACHE`` environment variable is set to ``1``, parsed programs are also persisted to
+    disk (under ``$XDG_CACHE_HOME/pyquil/calibrations``, defaulting to ``~/.cache``), so that later processes can
+    skip parsing unchanged calibrations. The oldest entries are evicted once the directory exceeds 64 MiB, and entries
+    are only loaded if the cache directory is private to the current user.
+    """
+    if os.getenv("PYQUIL_CALIB_CACHE") != "1":
+        return parse_program(quilt)
+
+    # Include the pyQuil version in the key so that pickles are invalidated when the program classes change.
+    path = cache_path("calibrations", pyquil_version, quilt, suffix=".pkl")
+    # Only unpickle entries that nobody but the current user could have written
+    data = read_entry(path, private_only=True)
+    if data is not None:
+        try:
+            return cast(Program, pickle.loads(data))
+        except Exception as ex:
+            _log.debug(f"Ignoring unreadable calibration cache entry {path}: {ex}")
+
+    program = parse_program(quilt)
+    try:
+        data = pickle.dumps(program)
+    except Exception as ex:
+        _log.debug(f"Unable to pickle calibration program: {ex}")
+    else:
+        write_entry(path, data, max_bytes=_CALIBRATION_DISK_CACHE_MAX_BYTES)
+    return program
+
+
 class QPUCompiler(AbstractCompiler):
     """
     Client to communicate with the compiler and translation service.
@@ -86,6 +137,7 @@ class QPUCompiler(AbstractCompiler):
         quantum_processor: AbstractQuantumProcessor,
         timeout: float = 10.0,
         client_configuration: Optional[QCSClientConfiguration] = None,
+        prefetch_calibrations: bool = False,
     ) -> None:
         """
         Instantiate a new QPU compiler client.
@@ -94,6 +146,8 @@ class QPUCompiler(AbstractCompiler):
         :param quantum_processor: Quantum processor to use as compilation target.
         :param timeout: Time limit for requests, in seconds.
         :param client_configuration: Optional client configuration. If none is provided, a default one will be loaded.
+        :param prefetch_calibrations: Whether to start fetching the calibration program in the background right away,
+            so that the first call to ``get_calibration_program`` does not wait on the full request.
         """
         super().__init__(
             quantum_processor=quantum_processor,
@@ -104,20 +158,65 @@ class QPUCompiler(AbstractCompiler):
         self.quantum_processor_id = quantum_processor_id
         self._calibration_program: Optional[Program] = None
         self._calibration_program_lock = threading.Lock()
+        self._calibration_program_future: Optional["Future[Program]"] = None
+        self._qcs_client_lock = threading.Lock()
+        self._qcs_client_stack: Optional[ExitStack] = None
+        self._qcs_http_client: Optional[httpx.Client] = None
+        if prefetch_calibrations:
+            self._prefetch_calibration_program()
 
     def native_quil_to_executable(self, nq_program: Program) -> QuantumExecutable:
         arithmetic_response = rewrite_arithmetic(nq_program)
+        response = self._translate_native_quil(arithmetic_response.quil, nq_program.num_shots)
+        return self._build_encrypted_program(nq_program, arithmetic_response, response)
 
-        request = TranslateNativeQuilToEncryptedBinaryRequest(
-            quil=arithmetic_response.quil, num_shots=nq_program.num_shots
-        )
+    def native_quil_to_executables(
+        self, nq_programs: Sequence[Program], *, max_workers: int = 16
+    ) -> List[QuantumExecutable]:
+        """
+        Translate several native Quil programs into executables.
+
+        The translation requests are issued concurrently, so that sweeps over many similar programs
+        are not bound by the latency of one round trip per program.
+
+        :param nq_programs: Native Quil programs to translate.
+        :param max_workers: Maximum number of translation requests in flight at once.
+        :returns: One executable per program, in the same order as ``nq_programs``.
+        """
+        nq_programs = list(nq_programs)
+        if not nq_programs:
+            return []
+
+        arithmetic_responses = [rewrite_arithmetic(nq_program) for nq_program in nq_programs]
+        with ThreadPoolExecutor(max_workers=min(len(nq_programs), max_workers)) as executor:
+            responses = list(
+                executor.map(
+                    self._translate_native_quil,
+                    [arithmetic_response.quil for arithmetic_response in arithmetic_responses],
+                    [nq_program.num_shots for nq_program in nq_programs],
+                )
+            )
+
+        return [
+            self._build_encrypted_program(nq_program, arithmetic_response, response)
+            for nq_program, arithmetic_response, response in zip(nq_programs, arithmetic_responses, responses)
+        ]
+
+    def _translate_native_quil(self, quil: str, num_shots: int) -> TranslateNativeQuilToEncryptedBinaryResponse:
+        request = TranslateNativeQuilToEncryptedBinaryRequest(quil=quil, num_shots=num_shots)
         with self._qcs_client() as qcs_client:  # type: httpx.Client
-            response = translate_native_quil_to_encrypted_binary(
+            return translate_native_quil_to_encrypted_binary(
                 client=qcs_client,
                 quantum_processor_id=self.quantum_processor_id,
                 json_body=request,
             ).parsed
 
+    @staticmethod
+    def _build_encrypted_program(
+        nq_program: Program,
+        arithmetic_response: RewriteArithmeticResponse,
+        response: TranslateNativeQuilToEncryptedBinaryResponse,
+    ) -> EncryptedProgram:
         ro_sources = cast(List[List[str]], [] if response.ro_sources == UNSET else response.ro_sources)
 
         def to_expression(rule: str) -> ExpressionDesignator:
@@ -139,7 +238,7 @@ class QPUCompiler(AbstractCompiler):
     def _fetch_calibration_program(self) -> Program:
         with self._qcs_client() as qcs_client:  # type: httpx.Client
             response = get_quilt_calibrations(client=qcs_client, quantum_processor_id=self.quantum_processor_id).parsed
-        return parse_program(response.quilt)
+        return _parse_calibration_program(response.quilt).copy()
 
     def get_calibration_program(self, force_refresh: bool = False) -> Program:
         """
@@ -156,28 +255,67 @@ class QPUCompiler(AbstractCompiler):
 
         :param force_refresh: Whether or not to fetch a new calibration program before returning.
         :returns: A Program object containing the calibration definitions."""
-        if force_refresh or self._calibration_program is None:
-            try:
-                self._calibration_program = self._fetch_calibration_program()
-            except Exception as ex:
-                raise RuntimeError("Could not fetch calibrations") from ex
-
-        assert self._calibration_program is not None
-        return self._calibration_program
+        calibration_program = self._calibration_program
+        if force_refresh or calibration_program is None:
+            with self._calibration_program_lock:
+                # Another thread may have fetched the calibrations while we were waiting on the lock
+                calibration_program = self._calibration_program
+                if force_refresh or calibration_program is None:
+                    future, self._calibration_program_future = self._calibration_program_future, None
+                    try:
+                        if future is not None and not force_refresh:
+                            calibration_program = future.result()
+                        else:
+                            calibration_program = self._fetch_calibration_program()
+                    except Exception as ex:
+                        raise RuntimeError("Could not fetch calibrations") from ex
+                    self._calibration_program = calibration_program
+
+        return calibration_program
 
     def reset(self) -> None:
         """
         Reset the state of the QPUCompiler.
         """
         super().reset()
-        self._calibration_program = None
+        # Wait for any fetch in flight, so that it can't repopulate the calibrations after they are cleared
+        with self._calibration_program_lock:
+            self._calibration_program = None
+            self._calibration_program_future = None
+
+    def _prefetch_calibration_program(self) -> None:
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._calibration_program_future = executor.submit(self._fetch_calibration_program)
+        # Let the worker thread exit once the fetch completes
+        executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        """
+        Close the QCS HTTP client and its connection pool, and any open connections to quilc.
+        """
+        with self._qcs_client_lock:
+            stack, self._qcs_client_stack = self._qcs_client_stack, None
+            self._qcs_http_client = None
+        if stack is not None:
+            stack.close()
+        super().close()
 
     @contextmanager
     def _qcs_client(self) -> Iterator[httpx.Client]:
-        with qcs_client(
-            client_configuration=self._client_configuration, request_timeout=self._timeout
-        ) as client:  # type: httpx.Client
-            yield client
+        # The QCS client is kept open across requests so that translations reuse pooled connections
+        # (and the access token) instead of building a new client per request.
+        client = self._qcs_http_client
+        if client is None:
+            with self._qcs_client_lock:
+                client = self._qcs_http_client
+                if client is None:
+                    stack = ExitStack()
+                    client = stack.enter_context(
+                        qcs_client(client_configuration=self._client_configuration, request_timeout=self._timeout)
+                    )
+                    self._qcs_client_stack = stack
+                    self._qcs_http_client = client
+        yield client
 
 
 class QVMCompiler(AbstractCompiler):
@@ -13,6 +13,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Iterator, Optional, List
@@ -164,6 +165,8 @@ class CompilerClient:
 
         self.base_url = base_url
         self.timeout = request_timeout
+        self._rpcq: Optional[rpcq.Client] = None
+        self._rpcq_lock = threading.Lock()
 
     def get_version(self) -> str:
         """
@@ -239,13 +242,33 @@ class CompilerClient:
             )
             return GenerateRandomizedBenchmarkingSequenceResponse(sequence=response.sequence)
 
+    def close(self) -> None:
+        """
+        Close the open connection to the compiler, if any. It is reopened on the next request.
+        """
+        with self._rpcq_lock:
+            client, self._rpcq = self._rpcq, None
+        if client is not None:
+            client.close()  # type: ignore
+
     @contextmanager
     def _rpcq_client(self) -> Iterator[rpcq.Client]:
-        client = rpcq.Client(
-            endpoint=self.base_url,
-            timeout=self.timeout,
-        )
-        try:
-            yield client
-        finally:
-            client.close()  # type: ignore
+        # One connection is kept open across requests, so that consecutive requests don't each set up a new ZeroMQ
+        # context and socket. ZeroMQ sockets must not be used by several threads at once, so requests hold the lock
+        # for their duration.
+        with self._rpcq_lock:
+            client = self._rpcq
+            if client is None:
+                client = self._rpcq = rpcq.Client(
+                    endpoint=self.base_url,
+                    timeout=self.timeout,
+                )
+            else:
+                client.timeout = self.timeout
+            try:
+                yield client
+            except TimeoutError:
+                # Don't leave an unanswered request queued on a socket that will be reused
+                self._rpcq = None
+                client.close()  # type: ignore
+                raise
@@ -0,0 +1,131 @@
+##############################################################################
+# Copyright 2016-2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+"""
+Helpers for the opt-in on-disk caches kept under ``$XDG_CACHE_HOME/pyquil`` (defaulting to ``~/.cache/pyquil``).
+
+Cache failures are never fatal: unreadable entries are treated as misses and failed writes are skipped.
+"""
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+from typing import Optional
+
+_log = logging.getLogger(__name__)
+
+
+def cache_path(namespace: str, *key_parts: str, suffix: str) -> str:
+    """
+    Build the path of a cache entry from the content it is derived from.
+
+    :param namespace: Subdirectory of the pyQuil cache directory holding this kind of entry.
+    :param key_parts: Strings that together determine the cached content.
+    :param suffix: File name suffix, e.g. ``.json``.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in key_parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pyquil", namespace, f"{digest.hexdigest()}{suffix}")
+
+
+def read_entry(path: str, *, private_only: bool = False) -> Optional[bytes]:
+    """
+    Read a cache entry, returning ``None`` if it is missing or unreadable.
+
+    :param path: Path of the entry, as returned by :py:func:`cache_path`.
+    :param private_only: If set, the entry is only read if it and the two directories above it are owned by the current
+        user and not writable by anyone else. Use this for entries whose contents are trusted when loaded, e.g.
+        pickles. On platforms without POSIX ownership, such entries are never read.
+    """
+    if private_only and not _is_private(path):
+        _log.debug(f"Ignoring cache entry {path} that is not private to the current user")
+        return None
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        _log.debug(f"Ignoring unreadable cache entry {path}: {ex}")
+        return None
+
+
+def write_entry(path: str, data: bytes, *, max_bytes: Optional[int] = None) -> None:
+    """
+    Write a cache entry.
+
+    The entry is written to a temporary file and renamed into place, so that concurrent readers never see a partial
+    entry.
+
+    :param path: Path of the entry, as returned by :py:func:`cache_path`.
+    :param data: Contents of the entry.
+    :param max_bytes: If given, the oldest entries in the same directory are deleted until their total size is at
+        most this many bytes.
+    """
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as ex:
+        _log.debug(f"Unable to write cache entry {path}: {ex}")
+        return
+
+    if max_bytes is not None:
+        _evict(cache_dir, max_bytes)
+
+
+def _is_private(path: str) -> bool:
+    if not hasattr(os, "getuid"):
+        return False
+    uid = os.getuid()
+    cache_dir = os.path.dirname(path)
+    for checked_path in (path, cache_dir, os.path.dirname(cache_dir)):
+        try:
+            st = os.lstat(checked_path)
+        except OSError:
+            return False
+        if stat.S_ISLNK(st.st_mode) or st.st_uid != uid or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return False
+    return True
+
+
+def _evict(cache_dir: str, max_bytes: int) -> None:
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.is_file() and not entry.name.endswith(".tmp")]
+        stats = sorted(((entry.path, entry.stat()) for entry in entries), key=lambda item: item[1].st_mtime)
+    except OSError as ex:
+        _log.debug(f"Unable to scan cache directory {cache_dir}: {ex}")
+        return
+
+    total = sum(entry_stat.st_size for _, entry_stat in stats)
+    for path, entry_stat in stats:
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= entry_stat.st_size
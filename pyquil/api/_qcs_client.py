@@ -33,14 +33,18 @@ def qcs_client(
     :param client_configuration: Client configuration.
     :param request_timeout: Time limit for requests, in seconds.
     """
-    _ensure_event_loop()
+    ensure_event_loop()
     with build_sync_client(
         configuration=client_configuration, client_kwargs={"timeout": request_timeout}
     ) as client:  # type: httpx.Client
         yield client
 
 
-def _ensure_event_loop() -> None:
+def ensure_event_loop() -> None:
+    """
+    Make sure the current thread has an asyncio event loop, creating one if necessary. The QCS API client needs one
+    even for synchronous requests.
+    """
     try:
         asyncio.get_event_loop()
     except RuntimeError as ex:
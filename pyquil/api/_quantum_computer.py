@@ -727,6 +727,7 @@ def get_qc(
     client_configuration: Optional[QCSClientConfiguration] = None,
     endpoint_id: Optional[str] = None,
     engagement_manager: Optional[EngagementManager] = None,
+    refresh_isa: bool = False,
 ) -> QuantumComputer:
     """
     Get a quantum computer.
@@ -797,6 +798,8 @@ def get_qc(
     :param client_configuration: Optional client configuration. If none is provided, a default one will be loaded.
     :param endpoint_id: Optional quantum processor endpoint ID, as used in the `QCS API Docs`_.
     :param engagement_manager: Optional engagement manager. If none is provided, a default one will be created.
+    :param refresh_isa: Whether to fetch the quantum processor's instruction set architecture from QCS even if one
+        was fetched recently. See :py:func:`~pyquil.quantum_processor.qcs.get_qcs_quantum_processor`.
 
     :return: A pre-configured QuantumComputer
 
@@ -848,7 +851,7 @@ def get_qc(
 
     # 4. Not a special case, query the web for information about this quantum_processor.
     quantum_processor = get_qcs_quantum_processor(
-        quantum_processor_id=prefix, client_configuration=client_configuration
+        quantum_processor_id=prefix, client_configuration=client_configuration, refresh=refresh_isa
     )
     if qvm_type is not None:
         # 4.1 QVM based on a real quantum_processor.
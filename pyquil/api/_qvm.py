@@ -14,19 +14,19 @@
 #    limitations under the License.
 ##############################################################################
 from dataclasses import dataclass
-from typing import Dict, Mapping, Optional, Sequence, Union, Tuple
+from typing import Dict, List, Mapping, Optional, Sequence, Union, Tuple, cast
 
 import numpy as np
 from qcs_api_client.client import QCSClientConfiguration
 
-from pyquil._version import pyquil_version
+from pyquil._version import parse_version, pyquil_version
 from pyquil.api import QuantumExecutable
 from pyquil.api._qam import QAM, QAMExecutionResult
 from pyquil.api._qvm_client import (
     QVMClient,
     RunProgramRequest,
 )
-from pyquil.noise import NoiseModel, apply_noise_model
+from pyquil.noise import NoiseModel, apply_noise_model, noise_model_program_header
 from pyquil.quil import Program, get_classical_addresses_from_program
 
 
@@ -44,7 +44,7 @@ def check_qvm_version(version: str) -> None:
 
     :param version: The version of the QVM
     """
-    major, minor, patch = map(int, version.split("."))
+    major, minor, _ = parse_version(version, "QVM")
     if major == 1 and minor < 8:
         raise QVMVersionMismatch(
             "Must use QVM >= 1.8.0 with pyquil >= 2.8.0, but you " f"have QVM {version} and pyquil {pyquil_version}"
@@ -98,6 +98,8 @@ http://pyquil.readthedocs.io/en/latest/noise_models.html#support-for-noisy-gates
             )
 
         self.noise_model = noise_model
+        # The noise model header (DEFGATEs and PRAGMAs) is the same for every program, so build it once per model
+        self._noise_model_header: Optional[Tuple[NoiseModel, Program]] = None
 
         validate_noise_probabilities(gate_noise)
         validate_noise_probabilities(measurement_noise)
@@ -133,14 +135,15 @@ http://pyquil.readthedocs.io/en/latest/noise_models.html#support-for-noisy-gates
 
         result_memory = {}
 
-        for region in executable.declarations.keys():
+        declarations = executable.declarations
+        for region in declarations.keys():
             result_memory[region] = np.ndarray((executable.num_shots, 0), dtype=np.int64)
 
         trials = executable.num_shots
         classical_addresses = get_classical_addresses_from_program(executable)
 
         if self.noise_model is not None:
-            executable = apply_noise_model(executable, self.noise_model)
+            executable = apply_noise_model(executable, self.noise_model, header=self._get_noise_model_header())
 
         executable._set_parameter_values_at_runtime()
 
@@ -153,8 +156,11 @@ http://pyquil.readthedocs.io/en/latest/noise_models.html#support-for-noisy-gates
             self.random_seed,
         )
         response = self._qvm_client.run_program(request)
-        ram = {key: np.array(val) for key, val in response.results.items()}
-        result_memory.update(ram)
+        # Give NumPy the dtype up front so it does not have to infer it from the nested lists
+        for region, values in response.results.items():
+            declaration = declarations.get(region)
+            dtype = np.float64 if declaration is not None and declaration.memory_type == "REAL" else np.int64
+            result_memory[region] = np.asarray(values, dtype=dtype)
 
         return QVMExecuteResponse(executable=executable, memory=result_memory)
 
@@ -166,6 +172,15 @@ http://pyquil.readthedocs.io/en/latest/noise_models.html#support-for-noisy-gates
         """
         return QAMExecutionResult(executable=execute_response.executable, readout_data=execute_response.memory)
 
+    def _get_noise_model_header(self) -> Program:
+        """
+        Return the program header for the current noise model, reusing it for as long as the noise model is unchanged.
+        """
+        assert self.noise_model is not None
+        if self._noise_model_header is None or self._noise_model_header[0] is not self.noise_model:
+            self._noise_model_header = (self.noise_model, noise_model_program_header(self.noise_model))
+        return self._noise_model_header[1]
+
     def get_version_info(self) -> str:
         """
         Return version information for the QVM.
@@ -185,13 +200,18 @@ def validate_noise_probabilities(noise_parameter: Optional[Tuple[float, float, f
         return
     if not isinstance(noise_parameter, tuple):
         raise TypeError("noise_parameter must be a tuple")
-    if any([not isinstance(value, float) for value in noise_parameter]):
-        raise TypeError("noise_parameter values should all be floats")
+    total = 0.0
+    has_negative = False
+    for value in noise_parameter:
+        if not isinstance(value, float):
+            raise TypeError("noise_parameter values should all be floats")
+        total += value
+        has_negative = has_negative or value < 0
     if len(noise_parameter) != 3:
         raise ValueError("noise_parameter tuple must be of length 3")
-    if sum(noise_parameter) > 1 or sum(noise_parameter) < 0:
+    if total > 1 or total < 0:
         raise ValueError("sum of entries in noise_parameter must be between 0 and 1 (inclusive)")
-    if any([value < 0 for value in noise_parameter]):
+    if has_negative:
         raise ValueError("noise_parameter values should all be non-negative")
 
 
@@ -199,9 +219,17 @@ def validate_qubit_list(qubit_list: Sequence[int]) -> Sequence[int]:
     """
     Check the validity of qubits for the payload.
 
-    :param qubit_list: List of qubits to be validated.
+    :param qubit_list: List of qubits to be validated. One-dimensional numpy arrays of integers are also accepted,
+        and are converted to a list of Python ints.
     """
-    if not isinstance(qubit_list, Sequence):
+    if isinstance(qubit_list, np.ndarray):
+        if qubit_list.ndim != 1:
+            raise TypeError("'qubit_list' must be of type 'Sequence'")
+        if not np.issubdtype(qubit_list.dtype, np.integer) or (qubit_list < 0).any():
+            raise TypeError("'qubit_list' must contain positive integer values")
+        return cast(List[int], qubit_list.tolist())
+    # Check the common concrete types before falling back to the (slower) ABC instance check
+    if type(qubit_list) not in (list, tuple) and not isinstance(qubit_list, Sequence):
         raise TypeError("'qubit_list' must be of type 'Sequence'")
     if any(not isinstance(i, int) or i < 0 for i in qubit_list):
         raise TypeError("'qubit_list' must contain positive integer values")
@@ -232,6 +260,21 @@ def prepare_register_list(
             assert v  # If boolean v must be True
             continue
 
+        if isinstance(v, np.ndarray) and v.ndim == 1:
+            # Convert in bulk rather than boxing one element at a time
+            array = v.astype(np.int64, copy=False)
+            if (array < 0).any():
+                raise TypeError("Negative indices into classical arrays are not allowed.")
+            register_dict[k] = array.tolist()
+            continue
+
+        if isinstance(v, range):
+            # A range is monotonic, so its smallest element is one of its endpoints
+            if len(v) > 0 and min(v[0], v[-1]) < 0:
+                raise TypeError("Negative indices into classical arrays are not allowed.")
+            register_dict[k] = list(v)
+            continue
+
         indices = [int(x) for x in v]  # support ranges, numpy, ...
 
         if not all(x >= 0 for x in indices):
@@ -254,10 +297,10 @@ def qvm_run_request(
             "You have attempted to run an empty program."
             " Please provide gates or measure instructions to your program."
         )
-    if not isinstance(quil_program, Program):
+    if __debug__ and not isinstance(quil_program, Program):
         raise TypeError("quil_program must be a Quil program object")
     classical_addresses = prepare_register_list(classical_addresses)
-    if not isinstance(trials, int):
+    if __debug__ and not isinstance(trials, int):
         raise TypeError("trials must be an integer")
 
     return RunProgramRequest(
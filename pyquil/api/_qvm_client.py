@@ -14,17 +14,46 @@
 #    limitations under the License.
 ##############################################################################
 import re
-from contextlib import contextmanager
+import threading
 from dataclasses import dataclass
 from json.decoder import JSONDecodeError
-from typing import Iterator, Any, Dict, Union, Tuple, Optional, List, cast
+from typing import Any, Dict, Union, Tuple, Optional, List, cast
 
 import httpx
+import numpy as np
 from qcs_api_client.client import QCSClientConfiguration
 
 from pyquil.api._errors import ApiError, UnknownApiError, TooManyQubitsError, error_mapping
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize numpy values that JSON encoders do not handle natively, matching ``orjson.OPT_SERIALIZE_NUMPY``.
+    """
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# orjson is not a pyQuil dependency; it is used opportunistically when installed for faster (de)serialization.
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default).encode("utf-8")
+
+    json_loads = json.loads
+
+_TOO_MANY_QUBITS_PATTERN = re.compile(r"[0-9]+ qubits were requested, but the QVM is limited to [0-9]+ qubits\.")
+
+
 @dataclass
 class RunProgramRequest:
     """
@@ -168,12 +197,30 @@ class QVMClient:
         """
         self.base_url = client_configuration.profile.applications.pyquil.qvm_url
         self.timeout = request_timeout
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+
+    def __enter__(self) -> "QVMClient":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP client and its connection pool, if open.
+        """
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
 
     def get_version(self) -> str:
         """
         Get version info for QVM server.
         """
-        return self._post_json({"type": "version"}).text.split()[0]
+        # The response is plain text of the form "<version> [<commit>]"
+        return self._post_json({"type": "version"}).text.split(None, 1)[0]
 
     def run_program(self, request: RunProgramRequest) -> RunProgramResponse:
         """
@@ -195,7 +242,9 @@ class QVMClient:
         if request.seed is not None:
             payload["rng-seed"] = request.seed
 
-        return RunProgramResponse(results=cast(Dict[str, List[List[int]]], self._post_json(payload).json()))
+        return RunProgramResponse(
+            results=cast(Dict[str, List[List[int]]], json_loads(self._post_json(payload).content))
+        )
 
     def run_and_measure_program(self, request: RunAndMeasureProgramRequest) -> RunAndMeasureProgramResponse:
         """
@@ -217,7 +266,7 @@ class QVMClient:
         if request.seed is not None:
             payload["rng-seed"] = request.seed
 
-        return RunAndMeasureProgramResponse(results=cast(List[List[int]], self._post_json(payload).json()))
+        return RunAndMeasureProgramResponse(results=cast(List[List[int]], json_loads(self._post_json(payload).content)))
 
     def measure_expectation(self, request: MeasureExpectationRequest) -> MeasureExpectationResponse:
         """
@@ -232,7 +281,7 @@ class QVMClient:
         if request.seed is not None:
             payload["rng-seed"] = request.seed
 
-        return MeasureExpectationResponse(expectations=cast(List[float], self._post_json(payload).json()))
+        return MeasureExpectationResponse(expectations=cast(List[float], json_loads(self._post_json(payload).content)))
 
     def get_wavefunction(self, request: GetWavefunctionRequest) -> GetWavefunctionResponse:
         """
@@ -255,16 +304,23 @@ class QVMClient:
         return GetWavefunctionResponse(wavefunction=self._post_json(payload).content)
 
     def _post_json(self, json: Dict[str, Any]) -> httpx.Response:
-        with self._http_client() as http:  # type: httpx.Client
-            response = http.post("/", json=json)
-            if response.status_code >= 400:
-                raise self._parse_error(response)
+        response = self._http_client().post("/", content=json_dumps(json), headers={"Content-Type": "application/json"})
+        if response.status_code >= 400:
+            raise self._parse_error(response)
         return response
 
-    @contextmanager
-    def _http_client(self) -> Iterator[httpx.Client]:
-        with httpx.Client(base_url=self.base_url, timeout=self.timeout) as client:
-            yield client
+    def _http_client(self) -> httpx.Client:
+        """
+        Return the HTTP client used for requests, creating it on first use. The client is kept open so that
+        connections to the QVM are reused across requests.
+        """
+        http = self._http
+        if http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+                http = self._http
+        return http
 
     @staticmethod
     def _parse_error(res: httpx.Response) -> ApiError:
@@ -277,7 +333,7 @@ class QVMClient:
         gateway problems, etc.)
         """
         try:
-            body = res.json()
+            body = json_loads(res.content)
         except JSONDecodeError:
             raise UnknownApiError(res.text)
 
@@ -287,7 +343,7 @@ class QVMClient:
         error_type = body["error_type"]
         status = body["status"]
 
-        if re.search(r"[0-9]+ qubits were requested, but the QVM is limited to [0-9]+ qubits.", status):
+        if _TOO_MANY_QUBITS_PATTERN.search(status):
             return TooManyQubitsError(status)
 
         error_cls = error_mapping.get(error_type, UnknownApiError)
@@ -4,6 +4,7 @@ import numpy as np
 from pyquil.quil import Program
 from pyquil.quilatom import MemoryReference, Expression, Sub, Div
 from pyquil.quilbase import (
+    AbstractInstruction,
     Declare,
     Gate,
     SetFrequency,
@@ -17,6 +18,20 @@ from rpcq.messages import ParameterSpec, ParameterAref, RewriteArithmeticRespons
 from typing import Dict, Union, List, no_type_check
 
 
+def _requires_rewrite(inst: AbstractInstruction) -> bool:
+    """Whether ``rewrite_arithmetic`` would emit anything other than ``inst`` itself."""
+    if isinstance(inst, Gate):
+        # Gates are rebuilt from their name, parameters and qubits, so modifiers also force a rewrite
+        return bool(inst.modifiers) or not all(isinstance(param, Real) for param in inst.params)
+    if isinstance(inst, (SetFrequency, ShiftFrequency)):
+        return not isinstance(inst.freq, Real)
+    if isinstance(inst, (SetPhase, ShiftPhase)):
+        return not isinstance(inst.phase, Real)
+    if isinstance(inst, SetScale):
+        return not isinstance(inst.scale, Real)
+    return False
+
+
 # TODO
 # The various reassignments to the variable expr make it difficult
 # to tie the typing down.
@@ -65,8 +80,17 @@ def rewrite_arithmetic(prog: Program) -> RewriteArithmeticResponse:
     def aref(ref: MemoryReference) -> ParameterAref:
         return ParameterAref(name=ref.name, index=ref.offset)
 
+    instructions = prog.instructions
+    old_descriptors = {inst.name: spec(inst) for inst in instructions if isinstance(inst, Declare)}
+    if not any(_requires_rewrite(inst) for inst in instructions):
+        # Nothing to rewrite, so the program serializes as-is
+        return RewriteArithmeticResponse(
+            quil=prog.out(),
+            original_memory_descriptors=old_descriptors,
+            recalculation_table={},
+        )
+
     updated = prog.copy_everything_except_instructions()
-    old_descriptors = {inst.name: spec(inst) for inst in prog if isinstance(inst, Declare)}
     recalculation_table: Dict[ParameterAref, str] = {}
     seen_exprs: Dict[str, MemoryReference] = {}
 
@@ -90,7 +114,7 @@ def rewrite_arithmetic(prog: Program) -> RewriteArithmeticResponse:
         recalculation_table[aref(new_mref)] = expr
         return new_mref
 
-    for inst in prog:
+    for inst in instructions:
         if isinstance(inst, Gate):
             new_params: List[Union[Real, MemoryReference]] = []
             for param in inst.params:
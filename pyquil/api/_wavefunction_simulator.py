@@ -32,8 +32,9 @@ from pyquil.api._qvm_client import (
 )
 from pyquil.gates import MOVE
 from pyquil.paulis import PauliSum, PauliTerm
-from pyquil.quil import Program, percolate_declares
+from pyquil.quil import Program
 from pyquil.quilatom import MemoryReference
+from pyquil.quilbase import Declare
 from pyquil.wavefunction import Wavefunction
 
 
@@ -146,10 +147,10 @@ class WavefunctionSimulator:
             prep_prog = self.augment_program_with_memory_values(prep_prog, memory_map)
 
         bare_results = self._expectation(prep_prog, progs)
-        results = coeffs * bare_results
         if is_pauli_sum:
-            return np.sum(results)  # type: ignore
-        return results  # type: ignore
+            # Multiply and reduce in one pass, without materializing the per-term products
+            return np.dot(coeffs, bare_results)  # type: ignore
+        return coeffs * bare_results  # type: ignore
 
     def _expectation(self, prep_prog: Program, operator_programs: Iterable[Program]) -> np.ndarray:
         if isinstance(operator_programs, Program):
@@ -223,24 +224,28 @@ class WavefunctionSimulator:
         quil_program: Program,
         memory_map: Dict[str, List[Union[int, float]]],
     ) -> Program:
-        p = Program()
-
         # we stupidly allowed memory_map to be of type Dict[MemoryReference, Any], whereas qc.run
         # takes a memory initialization argument of type Dict[str, List[Union[int, float]]. until
         # we are in a position to remove this, we support both styles of input.
 
         if len(memory_map.keys()) == 0:
             return quil_program
-        elif isinstance(list(memory_map.keys())[0], str):
-            for name, arr in memory_map.items():
-                for index, value in enumerate(arr):
-                    p += MOVE(MemoryReference(name, offset=index), value)
-        else:
+        elif not isinstance(next(iter(memory_map.keys())), str):
             raise TypeError("Bad memory_map type; expected Dict[str, List[Union[int, float]]].")
 
-        p += quil_program
+        moves = [
+            MOVE(MemoryReference(name, offset=index), value)
+            for name, arr in memory_map.items()
+            for index, value in enumerate(arr)
+        ]
+
+        # Splice the MOVEs in directly after the DECLAREs, rather than prepending them and percolating the
+        # DECLAREs back to the top of the program.
+        instructions = quil_program.instructions
+        declarations = [instr for instr in instructions if isinstance(instr, Declare)]
+        body = [instr for instr in instructions if not isinstance(instr, Declare)]
 
-        return percolate_declares(p)
+        return Program(quil_program.defined_gates, declarations, moves, body)
 
     def _run_and_measure_request(
         self,
@@ -252,10 +257,10 @@ class WavefunctionSimulator:
         if not quil_program:
             raise ValueError("Cannot execute an empty program")
 
-        if not isinstance(quil_program, Program):
+        if __debug__ and not isinstance(quil_program, Program):
             raise TypeError(f"quil_program must be a Program object, got type {type(quil_program)}")
         qubits = validate_qubit_list(qubits)
-        if not isinstance(trials, int):
+        if __debug__ and not isinstance(trials, int):
             raise TypeError(f"trials must be an integer, got type {type(trials)}")
 
         return RunAndMeasureProgramRequest(
@@ -272,7 +277,7 @@ class WavefunctionSimulator:
         *,
         quil_program: Program,
     ) -> GetWavefunctionRequest:
-        if not isinstance(quil_program, Program):
+        if __debug__ and not isinstance(quil_program, Program):
             raise TypeError(f"quil_program must be a Program object, got type {type(quil_program)}")
 
         return GetWavefunctionRequest(
@@ -291,7 +296,7 @@ class WavefunctionSimulator:
         if operator_programs is None:
             operator_programs = [Program()]
 
-        if not isinstance(prep_prog, Program):
+        if __debug__ and not isinstance(prep_prog, Program):
             raise TypeError(f"prep_prog must be a Program object, got type {type(prep_prog)}")
 
         return MeasureExpectationRequest(
@@ -18,7 +18,7 @@ Module for creating and verifying noisy gate and readout definitions.
 """
 import sys
 from collections import namedtuple
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING, Union
 
 import numpy as np
 
@@ -513,7 +513,7 @@ def decoherence_noise_with_asymmetric_ro(isa: CompilerISA, p00: float = 0.975, p
     return NoiseModel(noise_model.gates, aprobs)
 
 
-def _noise_model_program_header(noise_model: NoiseModel) -> "Program":
+def noise_model_program_header(noise_model: NoiseModel) -> "Program":
     """
     Generate the header for a pyquil Program that uses ``noise_model`` to overload noisy gates.
     The program header consists of 3 sections:
@@ -557,17 +557,19 @@ def _noise_model_program_header(noise_model: NoiseModel) -> "Program":
     return p
 
 
-def apply_noise_model(prog: "Program", noise_model: NoiseModel) -> "Program":
+def apply_noise_model(prog: "Program", noise_model: NoiseModel, header: Optional["Program"] = None) -> "Program":
     """
     Apply a noise model to a program and generated a 'noisy-fied' version of the program.
 
     :param prog: A Quil Program object.
     :param noise_model: A NoiseModel, either generated from an ISA or
         from a simple decoherence model.
+    :param header: The result of ``noise_model_program_header(noise_model)``, if already computed. It is not
+        modified, so callers applying one noise model to many programs can build it once.
     :return: A new program translated to a noisy gateset and with noisy readout as described by the
         noisemodel.
     """
-    new_prog = _noise_model_program_header(noise_model)
+    new_prog = noise_model_program_header(noise_model) if header is None else header.copy()
     for i in prog:
         if isinstance(i, Gate) and noise_model.gates:
             try:
@@ -817,8 +819,8 @@ def estimate_assignment_probs(
     return np.array([[p00, 1 - p11], [1 - p00, p11]])
 
 
-def _run(qc: "QuantumComputer", program: "Program") -> List[List[int]]:
+def _run(qc: "QuantumComputer", program: "Program") -> np.ndarray:
     result = qc.run(qc.compiler.native_quil_to_executable(program))
     bitstrings = result.readout_data.get("ro")
     assert bitstrings is not None
-    return cast(List[List[int]], bitstrings.tolist())
+    return bitstrings
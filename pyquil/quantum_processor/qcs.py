@@ -1,4 +1,7 @@
-from typing import List, Optional
+import copy
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 import networkx as nx
@@ -58,24 +61,57 @@ class QCSQuantumProcessor(AbstractQuantumProcessor):
         return str(self)
 
 
+_ISA_CACHE_TTL_SECONDS = 600.0
+"""How long a fetched ``InstructionSetArchitecture`` is reused by ``get_qcs_quantum_processor``."""
+
+_isa_cache: Dict[Tuple[str, str], Tuple[float, InstructionSetArchitecture]] = {}
+_isa_cache_lock = threading.Lock()
+
+
+def _now() -> float:
+    """The clock used to expire cached architectures."""
+    return time.monotonic()
+
+
 def get_qcs_quantum_processor(
     quantum_processor_id: str,
     client_configuration: Optional[QCSClientConfiguration] = None,
     timeout: float = 10.0,
+    refresh: bool = False,
 ) -> QCSQuantumProcessor:
     """
     Retrieve an instruction set architecture for the specified ``quantum_processor_id`` and initialize a
     ``QCSQuantumProcessor`` with it.
 
+    Architectures change rarely, so each one is reused for up to ten minutes after it is fetched. Each returned
+    ``QCSQuantumProcessor`` gets its own copy of the architecture. Pass ``refresh=True`` to always fetch it.
+
     :param quantum_processor_id: QCS ID for the quantum processor.
     :param timeout: Time limit for request, in seconds.
     :param client_configuration: Optional client configuration. If none is provided, a default one will
            be loaded.
+    :param refresh: Whether to fetch the instruction set architecture even if a recently fetched one is available.
 
     :return: A ``QCSQuantumProcessor`` with the requested ISA.
     """
     client_configuration = client_configuration or QCSClientConfiguration.load()
-    with qcs_client(client_configuration=client_configuration, request_timeout=timeout) as client:  # type: httpx.Client
-        isa = get_instruction_set_architecture(client=client, quantum_processor_id=quantum_processor_id).parsed
+    cache_key = (client_configuration.profile.api_url, quantum_processor_id)
+
+    with _isa_cache_lock:
+        cached = _isa_cache.get(cache_key)
+    if not refresh and cached is not None and _now() - cached[0] < _ISA_CACHE_TTL_SECONDS:
+        # Don't share the cached architecture between quantum processors, which may modify theirs
+        isa = copy.deepcopy(cached[1])
+    else:
+        isa = _fetch_isa(quantum_processor_id, client_configuration, timeout)
+        with _isa_cache_lock:
+            _isa_cache[cache_key] = (_now(), copy.deepcopy(isa))
 
     return QCSQuantumProcessor(quantum_processor_id=quantum_processor_id, isa=isa)
+
+
+def _fetch_isa(
+    quantum_processor_id: str, client_configuration: QCSClientConfiguration, timeout: float
+) -> InstructionSetArchitecture:
+    with qcs_client(client_configuration=client_configuration, request_timeout=timeout) as client:  # type: httpx.Client
+        return get_instruction_set_architecture(client=client, quantum_processor_id=quantum_processor_id).parsed
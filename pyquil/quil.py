@@ -503,6 +503,10 @@ class Program:
         """
         Prepend instructions to the beginning of the program.
         """
+        instructions = list(instructions)
+        for instruction in instructions:
+            if isinstance(instruction, Declare):
+                self._declarations.setdefault(instruction.name, instruction)
         self._instructions = [*instructions, *self._instructions]
         self._synthesized_instructions = None
         return self
@@ -821,6 +825,13 @@ class Program:
         """
         res = self._instructions.pop()
         self._synthesized_instructions = None
+        if isinstance(res, Declare) and self._declarations.get(res.name) is res:
+            del self._declarations[res.name]
+            # Fall back to an earlier declaration of the same name, if the program has one
+            for instruction in reversed(self._instructions):
+                if isinstance(instruction, Declare) and instruction.name == res.name:
+                    self._declarations[res.name] = instruction
+                    break
         return res
 
     def dagger(self, inv_dict: Optional[Any] = None, suffix: str = "-INV") -> "Program":
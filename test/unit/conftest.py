@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -26,31 +27,54 @@ from pyquil.quil import Program
 from test.unit.utils import DummyCompiler, CLIENT_PUBLIC_KEY, CLIENT_SECRET_KEY, SERVER_PUBLIC_KEY
 
 TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data")
+ASPEN8_COMPILER_ISA_PATH = os.path.join(TEST_DATA_DIR, "compiler-isa-Aspen-8.json")
+ASPEN8_QCS_ISA_PATH = os.path.join(TEST_DATA_DIR, "qcs-isa-Aspen-8.json")
 
+GATES_1Q = [g for gate in DEFAULT_1Q_GATES for g in _transform_qubit_operation_to_gates(gate)]
+GATES_2Q = [g for gate in DEFAULT_2Q_GATES for g in _transform_edge_operation_to_gates(gate)]
 
-@pytest.fixture
+
+@lru_cache(maxsize=1)
+def _load_qcs_isa(path: str) -> InstructionSetArchitecture:
+    """
+    Load a QCS ``InstructionSetArchitecture`` from file. The result is cached, so callers
+    must treat it as read-only.
+    """
+    with open(path) as f:
+        return InstructionSetArchitecture.from_dict(json.load(f))
+
+
+@lru_cache()
+def _load_client_configuration(secrets_file_path: str, settings_file_path: str) -> QCSClientConfiguration:
+    """
+    Load a ``QCSClientConfiguration`` from the given files. Configurations are cached by path, independently of
+    fixture scoping, so callers must treat them as read-only.
+    """
+    return QCSClientConfiguration.load(
+        secrets_file_path=Path(secrets_file_path),
+        settings_file_path=Path(settings_file_path),
+    )
+
+
+@pytest.fixture(scope="session")
 def compiler_isa() -> CompilerISA:
     """
     Configures an arbitrary ``CompilerISA`` that may be used to initialize
     a ``CompilerQuantumProcessor``. Developers should create specific test cases of
     ``CompilerISA`` as separate fixtures in conftest.py or in the test file.
+
+    This fixture is session-scoped, so tests must not mutate the returned ``CompilerISA``.
     """
-    gates_1q = []
-    for gate in DEFAULT_1Q_GATES:
-        gates_1q.extend(_transform_qubit_operation_to_gates(gate))
-    gates_2q = []
-    for gate in DEFAULT_2Q_GATES:
-        gates_2q.extend(_transform_edge_operation_to_gates(gate))
     return CompilerISA.parse_obj(
         {
             "1Q": {
-                "0": {"id": 0, "gates": gates_1q},
-                "1": {"id": 1, "gates": gates_1q},
-                "2": {"id": 2, "gates": gates_1q},
+                "0": {"id": 0, "gates": GATES_1Q},
+                "1": {"id": 1, "gates": GATES_1Q},
+                "2": {"id": 2, "gates": GATES_1Q},
                 "3": {"id": 3, "dead": True},
             },
             "2Q": {
-                "0-1": {"ids": [0, 1], "gates": gates_2q},
+                "0-1": {"ids": [0, 1], "gates": GATES_2Q},
                 "1-2": {
                     "ids": [1, 2],
                     "gates": [
@@ -79,31 +103,30 @@ def compiler_isa() -> CompilerISA:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def compiler_quantum_processor(compiler_isa: CompilerISA) -> CompilerQuantumProcessor:
     return CompilerQuantumProcessor(isa=compiler_isa)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aspen8_compiler_isa() -> CompilerISA:
     """
     Read the Aspen-8 QCS ``CompilerISA`` from file. This should be an exact conversion of
     qcs_aspen8_isa to a ``CompilerISA``.
     """
-    return CompilerISA.parse_file(os.path.join(TEST_DATA_DIR, "compiler-isa-Aspen-8.json"))
+    return CompilerISA.parse_file(ASPEN8_COMPILER_ISA_PATH)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def qcs_aspen8_isa() -> InstructionSetArchitecture:
     """
     Read the Aspen-8 QCS InstructionSetArchitecture from file and load it into
-    the ``InstructionSetArchitecture`` QCS API client model.
+    the ``InstructionSetArchitecture`` QCS API client model. Shared across the session; do not mutate.
     """
-    with open(os.path.join(TEST_DATA_DIR, "qcs-isa-Aspen-8.json")) as f:
-        return InstructionSetArchitecture.from_dict(json.load(f))
+    return _load_qcs_isa(ASPEN8_QCS_ISA_PATH)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def qcs_aspen8_quantum_processor(qcs_aspen8_isa: InstructionSetArchitecture) -> QCSQuantumProcessor:
     return QCSQuantumProcessor(quantum_processor_id="Aspen-8", isa=qcs_aspen8_isa)
 
@@ -131,7 +154,7 @@ def noise_model_dict() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def compiler(compiler_quantum_processor: CompilerQuantumProcessor, client_configuration: QCSClientConfiguration):
     compiler = QVMCompiler(
         quantum_processor=compiler_quantum_processor, timeout=1, client_configuration=client_configuration
@@ -148,9 +171,9 @@ def dummy_compiler(qcs_aspen8_quantum_processor: QCSQuantumProcessor, client_con
 
 @pytest.fixture(scope="session")
 def client_configuration() -> QCSClientConfiguration:
-    return QCSClientConfiguration.load(
-        secrets_file_path=Path(os.path.join(TEST_DATA_DIR, "qcs_secrets.toml")),
-        settings_file_path=Path(os.path.join(TEST_DATA_DIR, "qcs_settings.toml")),
+    return _load_client_configuration(
+        os.path.join(TEST_DATA_DIR, "qcs_secrets.toml"),
+        os.path.join(TEST_DATA_DIR, "qcs_settings.toml"),
     )
 
 
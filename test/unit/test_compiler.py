@@ -1,9 +1,23 @@
 import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import networkx as nx
+import pytest
+from pytest_mock import MockerFixture
+from qcs_api_client.client import QCSClientConfiguration
 
 from pyquil import Program
-from pyquil.api._compiler import QPUCompiler
+from pyquil._version import parse_version
+from pyquil.api._compiler import QPUCompiler, QVMCompiler, _parse_calibration_program, parse_mref
+from pyquil.api._abstract_compiler import QuilcVersionMismatch, _check_quilc_version
+from pyquil.api._compiler_client import CompileToNativeQuilResponse, NativeQuilMetadataResponse
+from pyquil.parser import parse_program
+from pyquil.quantum_processor import NxQuantumProcessor, QCSQuantumProcessor
 from pyquil.gates import RX, MEASURE, RZ
-from pyquil.quilatom import FormalArgument
+from pyquil.quilatom import FormalArgument, MemoryReference
 from pyquil.quilbase import DefCalibration
 
 
@@ -26,3 +40,352 @@ def test_compile_with_quilt_calibrations(compiler: QPUCompiler):
     assert compilation_result.calibrations == cals
     assert program.calibrations == cals
     assert compilation_result == program
+
+
+def test_quil_to_native_quil__reuses_target_and_version_check(
+    mocker: MockerFixture,
+    qcs_aspen8_quantum_processor: QCSQuantumProcessor,
+    client_configuration: QCSClientConfiguration,
+):
+    compiler = QVMCompiler(quantum_processor=qcs_aspen8_quantum_processor, client_configuration=client_configuration)
+    get_version = mocker.patch.object(compiler._compiler_client, "get_version", return_value="1.23.0")
+    compile_to_native_quil = mocker.patch.object(
+        compiler._compiler_client,
+        "compile_to_native_quil",
+        return_value=CompileToNativeQuilResponse(native_program="X 0\n", metadata=None),
+    )
+    to_compiler_isa = mocker.spy(qcs_aspen8_quantum_processor, "to_compiler_isa")
+
+    compiler.quil_to_native_quil(Program("X 0"))
+    compiler.quil_to_native_quil(Program("X 1"))
+    assert to_compiler_isa.call_count == 1
+    assert get_version.call_count == 1
+    targets = [call.args[0].target_quantum_processor for call in compile_to_native_quil.call_args_list]
+    assert targets[0] is targets[1]
+
+    close_compiler_client = mocker.spy(compiler._compiler_client, "close")
+    compiler.reset()
+    assert close_compiler_client.call_count == 1
+    compiler.quil_to_native_quil(Program("X 0"))
+    assert to_compiler_isa.call_count == 2
+    assert get_version.call_count == 2
+
+
+def test_quil_to_native_quil__reset_picks_up_in_place_processor_changes(
+    mocker: MockerFixture, client_configuration: QCSClientConfiguration
+):
+    quantum_processor = NxQuantumProcessor(nx.Graph([(0, 1)]))
+    compiler = QVMCompiler(quantum_processor=quantum_processor, client_configuration=client_configuration)
+    mocker.patch.object(compiler._compiler_client, "get_version", return_value="1.23.0")
+    compile_to_native_quil = mocker.patch.object(
+        compiler._compiler_client,
+        "compile_to_native_quil",
+        return_value=CompileToNativeQuilResponse(native_program="X 0\n", metadata=None),
+    )
+
+    compiler.quil_to_native_quil(Program("X 0"))
+    quantum_processor.topology.add_edge(1, 2)
+    compiler.reset()
+    compiler.quil_to_native_quil(Program("X 0"))
+
+    qubits = [call.args[0].target_quantum_processor.isa["1Q"].keys() for call in compile_to_native_quil.call_args_list]
+    assert set(qubits[0]) == {"0", "1"}
+    assert set(qubits[1]) == {"0", "1", "2"}
+
+
+def test_quil_to_native_quil__reuses_compiled_programs(
+    mocker: MockerFixture,
+    qcs_aspen8_quantum_processor: QCSQuantumProcessor,
+    client_configuration: QCSClientConfiguration,
+):
+    compiler = QVMCompiler(quantum_processor=qcs_aspen8_quantum_processor, client_configuration=client_configuration)
+    mocker.patch.object(compiler._compiler_client, "get_version", return_value="1.23.0")
+    compile_to_native_quil = mocker.patch.object(
+        compiler._compiler_client,
+        "compile_to_native_quil",
+        return_value=CompileToNativeQuilResponse(
+            native_program="RX(pi) 0\n",
+            metadata=NativeQuilMetadataResponse(
+                final_rewiring=[0],
+                gate_depth=1,
+                gate_volume=1,
+                multiqubit_gate_depth=0,
+                program_duration=40.0,
+                program_fidelity=0.99,
+                topological_swaps=0,
+                qpu_runtime_estimation=None,
+            ),
+        ),
+    )
+    program = Program("X 0")
+    program.wrap_in_numshots_loop(10)
+
+    first = compiler.quil_to_native_quil(program)
+    first.native_quil_metadata.final_rewiring.append(1)
+    second = compiler.quil_to_native_quil(program)
+    assert compile_to_native_quil.call_count == 1
+    assert first is not second
+    assert first.out() == second.out()
+    assert second.num_shots == 10
+    assert second.native_quil_metadata.final_rewiring == [0]
+
+    compiler.quil_to_native_quil(program, protoquil=True)
+    assert compile_to_native_quil.call_count == 2
+
+    compiler.reset()
+    compiler.quil_to_native_quil(program)
+    assert compile_to_native_quil.call_count == 3
+
+
+def test_quil_to_native_quil__uses_disk_cache_when_enabled(
+    mocker: MockerFixture,
+    monkeypatch,
+    tmp_path,
+    qcs_aspen8_quantum_processor: QCSQuantumProcessor,
+    client_configuration: QCSClientConfiguration,
+):
+    monkeypatch.setenv("PYQUIL_NATIVE_QUIL_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    response = CompileToNativeQuilResponse(
+        native_program="RX(pi) 0\n",
+        metadata=NativeQuilMetadataResponse(
+            final_rewiring=[0],
+            gate_depth=1,
+            gate_volume=1,
+            multiqubit_gate_depth=0,
+            program_duration=40.0,
+            program_fidelity=0.99,
+            topological_swaps=0,
+            qpu_runtime_estimation=None,
+        ),
+    )
+    compile_to_native_quil = mocker.patch(
+        "pyquil.api._compiler_client.CompilerClient.compile_to_native_quil", return_value=response
+    )
+    get_version = mocker.patch("pyquil.api._compiler_client.CompilerClient.get_version", return_value="1.23.0")
+
+    # Separate compilers stand in for separate processes, which only share the disk cache
+    compilers = [
+        QVMCompiler(quantum_processor=qcs_aspen8_quantum_processor, client_configuration=client_configuration)
+        for _ in range(3)
+    ]
+    first, second = [compiler.quil_to_native_quil(Program("X 0")) for compiler in compilers[:2]]
+
+    assert compile_to_native_quil.call_count == 1
+    assert get_version.call_count == 2
+    assert len(os.listdir(tmp_path / "pyquil" / "native_quil")) == 1
+    assert first == second
+    assert second.native_quil_metadata.final_rewiring == [0]
+    assert second.native_quil_metadata.program_fidelity == 0.99
+
+    # Output from a different quilc version is not reused
+    get_version.return_value = "1.24.0"
+    compilers[2].quil_to_native_quil(Program("X 0"))
+    assert compile_to_native_quil.call_count == 2
+    assert len(os.listdir(tmp_path / "pyquil" / "native_quil")) == 2
+
+
+def test_get_calibration_program__parses_shared_calibrations_once(
+    mocker: MockerFixture,
+    qcs_aspen8_quantum_processor: QCSQuantumProcessor,
+    client_configuration: QCSClientConfiguration,
+):
+    _parse_calibration_program.cache_clear()
+    mocker.patch("pyquil.api._compiler.qcs_client")
+    get_quilt_calibrations = mocker.patch("pyquil.api._compiler.get_quilt_calibrations")
+    get_quilt_calibrations.return_value.parsed.quilt = "DEFCAL X 0:\n    NOP\n"
+    parse = mocker.patch("pyquil.api._compiler.parse_program", wraps=parse_program)
+
+    compilers = [
+        QPUCompiler(
+            quantum_processor_id="Aspen-8",
+            quantum_processor=qcs_aspen8_quantum_processor,
+            client_configuration=client_configuration,
+        )
+        for _ in range(2)
+    ]
+    calibration_programs = [compiler.get_calibration_program() for compiler in compilers]
+
+    assert parse.call_count == 1
+    assert calibration_programs[0] is not calibration_programs[1]
+    assert calibration_programs[0].out() == calibration_programs[1].out() == "DEFCAL X 0:\n    NOP\n\n"
+
+
+def test_get_calibration_program__fetches_once_under_concurrent_access(
+    mocker: MockerFixture,
+    qcs_aspen8_quantum_processor: QCSQuantumProcessor,
+    client_configuration: QCSClientConfiguration,
+):
+    compiler = QPUCompiler(
+        quantum_processor_id="Aspen-8",
+        quantum_processor=qcs_aspen8_quantum_processor,
+        client_configuration=client_configuration,
+    )
+
+    def slow_fetch() -> Program:
+        time.sleep(0.05)
+        return Program("DEFCAL X 0:\n    NOP\n")
+
+    fetch = mocker.patch.object(compiler, "_fetch_calibration_program", side_effect=slow_fetch)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        calibration_programs = list(executor.map(lambda _: compiler.get_calibration_program(), range(4)))
+
+    assert fetch.call_count == 1
+    assert all(program is calibration_programs[0] for program in calibration_programs)
+
+    compiler.get_calibration_program(force_refresh=True)
+    assert fetch.call_count == 2
+
+
+def test_reset__waits_for_calibration_fetch_in_flight(
+    mocker: MockerFixture,
+    qcs_aspen8_quantum_processor: QCSQuantumProcessor,
+    client_configuration: QCSClientConfiguration,
+):
+    compiler = QPUCompiler(
+        quantum_processor_id="Aspen-8",
+        quantum_processor=qcs_aspen8_quantum_processor,
+        client_configuration=client_configuration,
+    )
+    fetch_started = threading.Event()
+    release_fetch = threading.Event()
+
+    def blocked_fetch() -> Program:
+        fetch_started.set()
+        release_fetch.wait()
+        return Program("DEFCAL X 0:\n    NOP\n")
+
+    mocker.patch.object(compiler, "_fetch_calibration_program", side_effect=blocked_fetch)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fetched = executor.submit(compiler.get_calibration_program)
+        fetch_started.wait()
+        reset = executor.submit(compiler.reset)
+        time.sleep(0.05)
+        release_fetch.set()
+        fetched.result()
+        reset.result()
+
+    assert compiler._calibration_program is None
+
+
+def test_get_calibration_program__uses_prefetched_calibrations(
+    mocker: MockerFixture,
+    qcs_aspen8_quantum_processor: QCSQuantumProcessor,
+    client_configuration: QCSClientConfiguration,
+):
+    calibration_program = Program("DEFCAL X 0:\n    NOP\n")
+    fetch = mocker.patch.object(QPUCompiler, "_fetch_calibration_program", return_value=calibration_program)
+
+    compiler = QPUCompiler(
+        quantum_processor_id="Aspen-8",
+        quantum_processor=qcs_aspen8_quantum_processor,
+        client_configuration=client_configuration,
+        prefetch_calibrations=True,
+    )
+
+    assert compiler.get_calibration_program() is calibration_program
+    assert compiler.get_calibration_program() is calibration_program
+    assert fetch.call_count == 1
+
+    fetch.side_effect = ValueError("unavailable")
+    compiler.reset()
+    compiler._prefetch_calibration_program()
+    with pytest.raises(RuntimeError, match="Could not fetch calibrations"):
+        compiler.get_calibration_program()
+
+
+def test_native_quil_to_executables(
+    mocker: MockerFixture,
+    qcs_aspen8_quantum_processor: QCSQuantumProcessor,
+    client_configuration: QCSClientConfiguration,
+):
+    mocker.patch("pyquil.api._compiler.qcs_client")
+
+    def translate(*, client, quantum_processor_id, json_body):
+        return mocker.Mock(parsed=mocker.Mock(program=json_body.quil, ro_sources=[["ro[0]", "q0"]]))
+
+    translate_mock = mocker.patch(
+        "pyquil.api._compiler.translate_native_quil_to_encrypted_binary", side_effect=translate
+    )
+    compiler = QPUCompiler(
+        quantum_processor_id="Aspen-8",
+        quantum_processor=qcs_aspen8_quantum_processor,
+        client_configuration=client_configuration,
+    )
+    programs = [Program("DECLARE ro BIT", RX(angle, 0), MEASURE(0, ("ro", 0))) for angle in [0.1, 0.2, 0.3]]
+
+    executables = compiler.native_quil_to_executables(programs)
+
+    assert translate_mock.call_count == 3
+    assert [executable.program for executable in executables] == [program.out() for program in programs]
+    assert all(executable.ro_sources == {MemoryReference("ro", 0): "q0"} for executable in executables)
+    assert compiler.native_quil_to_executables([]) == []
+
+
+def test_qcs_client__reused_until_closed(
+    mocker: MockerFixture,
+    qcs_aspen8_quantum_processor: QCSQuantumProcessor,
+    client_configuration: QCSClientConfiguration,
+):
+    qcs_client = mocker.patch("pyquil.api._compiler.qcs_client")
+    get_quilt_calibrations = mocker.patch("pyquil.api._compiler.get_quilt_calibrations")
+    get_quilt_calibrations.return_value.parsed.quilt = ""
+    compiler = QPUCompiler(
+        quantum_processor_id="Aspen-8",
+        quantum_processor=qcs_aspen8_quantum_processor,
+        client_configuration=client_configuration,
+    )
+
+    compiler.get_calibration_program()
+    compiler.get_calibration_program(force_refresh=True)
+    assert qcs_client.call_count == 1
+    assert qcs_client.return_value.__exit__.call_count == 0
+
+    close_compiler_client = mocker.spy(compiler._compiler_client, "close")
+    compiler.close()
+    assert qcs_client.return_value.__exit__.call_count == 1
+    assert close_compiler_client.call_count == 1
+
+    compiler.get_calibration_program(force_refresh=True)
+    assert qcs_client.call_count == 2
+
+
+def test_parse_calibration_program__uses_disk_cache_when_enabled(mocker: MockerFixture, monkeypatch, tmp_path):
+    monkeypatch.setenv("PYQUIL_CALIB_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    quilt = "DEFCAL X 0:\n    NOP\n"
+
+    _parse_calibration_program.cache_clear()
+    parsed = _parse_calibration_program(quilt)
+    assert len(os.listdir(tmp_path / "pyquil" / "calibrations")) == 1
+
+    # A fresh process (simulated by clearing the in-memory cache) loads the program without parsing
+    _parse_calibration_program.cache_clear()
+    parse = mocker.patch("pyquil.api._compiler.parse_program")
+    assert _parse_calibration_program(quilt).out() == parsed.out()
+    parse.assert_not_called()
+    _parse_calibration_program.cache_clear()
+
+
+def test_parse_mref():
+    assert parse_mref("ro") == MemoryReference("ro")
+    assert parse_mref(" ro[3] ") == MemoryReference("ro", 3)
+    assert parse_mref("theta-1[10]") == MemoryReference("theta-1", 10)
+    assert parse_mref("ro[3]") is parse_mref("ro[3]")
+
+    for val in ["", "ro[", "ro[[0]", "ro[-1]", "ro[1][2]", "ro[a]"]:
+        with pytest.raises(ValueError, match="Unable to parse memory reference"):
+            parse_mref(val)
+
+
+def test_check_quilc_version():
+    assert parse_version("1.23.0", "quilc") == (1, 23, 0)
+    assert parse_version("1.23.0-dev", "quilc") == (1, 23, 0)
+    _check_quilc_version("1.8.0")
+
+    with pytest.raises(QuilcVersionMismatch):
+        _check_quilc_version("1.7.2")
+    with pytest.raises(ValueError, match="Unable to parse quilc version"):
+        _check_quilc_version("unknown")
@@ -13,6 +13,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
+from concurrent.futures import ThreadPoolExecutor
 
 import rpcq
 from _pytest.monkeypatch import MonkeyPatch
@@ -66,6 +67,52 @@ def test_sets_timeout_on_requests(mocker: MockerFixture):
         assert client.timeout == compiler_client.timeout
 
 
+def test_rpcq_client__reused_until_closed(mocker: MockerFixture):
+    client_configuration = QCSClientConfiguration.load()
+    compiler_client = CompilerClient(client_configuration=client_configuration)
+
+    rpcq_client = patch_rpcq_client(mocker=mocker, return_value={"quilc": "1.2.3"})
+
+    compiler_client.get_version()
+    compiler_client.get_version()
+    assert rpcq.Client.call_count == 1
+    rpcq_client.close.assert_not_called()
+
+    compiler_client.close()
+    rpcq_client.close.assert_called_once_with()
+
+    compiler_client.get_version()
+    assert rpcq.Client.call_count == 2
+
+
+def test_rpcq_client__shared_across_threads(mocker: MockerFixture):
+    client_configuration = QCSClientConfiguration.load()
+    compiler_client = CompilerClient(client_configuration=client_configuration)
+
+    patch_rpcq_client(mocker=mocker, return_value={"quilc": "1.2.3"})
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(lambda _: compiler_client.get_version(), range(8))) == ["1.2.3"] * 8
+    assert rpcq.Client.call_count == 1
+
+
+def test_rpcq_client__discarded_after_timeout(mocker: MockerFixture):
+    client_configuration = QCSClientConfiguration.load()
+    compiler_client = CompilerClient(client_configuration=client_configuration)
+
+    rpcq_client = patch_rpcq_client(mocker=mocker, return_value=None)
+    rpcq_client.call.side_effect = TimeoutError("timed out")
+
+    with raises(TimeoutError):
+        compiler_client.get_version()
+    rpcq_client.close.assert_called_once_with()
+
+    rpcq_client.call.side_effect = None
+    rpcq_client.call.return_value = {"quilc": "1.2.3"}
+    assert compiler_client.get_version() == "1.2.3"
+    assert rpcq.Client.call_count == 2
+
+
 def test_get_version__returns_version(mocker: MockerFixture):
     client_configuration = QCSClientConfiguration.load()
     compiler_client = CompilerClient(client_configuration=client_configuration)
@@ -0,0 +1,42 @@
+import os
+
+from pyquil.api._disk_cache import cache_path, read_entry, write_entry
+
+
+def test_cache_path__depends_on_every_key_part(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    path = cache_path("things", "a", "bc", suffix=".json")
+
+    assert os.path.dirname(path) == str(tmp_path / "pyquil" / "things")
+    assert path.endswith(".json")
+    assert path == cache_path("things", "a", "bc", suffix=".json")
+    assert path != cache_path("things", "ab", "c", suffix=".json")
+
+
+def test_read_entry__returns_none_when_missing(tmp_path):
+    assert read_entry(str(tmp_path / "missing.json")) is None
+
+
+def test_write_entry__evicts_oldest_entries(tmp_path):
+    paths = [str(tmp_path / f"{i}.json") for i in range(3)]
+    for i, path in enumerate(paths):
+        write_entry(path, b"x" * 10, max_bytes=25)
+        os.utime(path, (i, i))
+
+    assert read_entry(paths[0]) is None
+    assert read_entry(paths[1]) == b"x" * 10
+    assert read_entry(paths[2]) == b"x" * 10
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_read_entry__private_only_rejects_shared_entries(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    path = cache_path("things", "a", suffix=".pkl")
+    write_entry(path, b"data")
+
+    assert read_entry(path, private_only=True) == b"data"
+
+    os.chmod(os.path.dirname(path), 0o777)
+    assert read_entry(path, private_only=True) is None
+    assert read_entry(path) == b"data"
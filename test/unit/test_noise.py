@@ -18,7 +18,7 @@ from pyquil.noise import (
     damping_after_dephasing,
     INFINITY,
     apply_noise_model,
-    _noise_model_program_header,
+    noise_model_program_header,
     KrausModel,
     NoiseModel,
     corrupt_bitstring_probs,
@@ -150,7 +150,7 @@ def test_decoherence_noise():
     new_prog = apply_noise_model(prog, m3)
 
     # check that headers have been embedded
-    headers = _noise_model_program_header(m3)
+    headers = noise_model_program_header(m3)
     assert all(
         (isinstance(i, Pragma) and i.command in ["ADD-KRAUS", "READOUT-POVM"]) or isinstance(i, DefGate)
         for i in headers
@@ -1,6 +1,13 @@
 from typing import Dict, Any
+
+import respx
+from _pytest.monkeypatch import MonkeyPatch
+from pytest_mock import MockerFixture
+from qcs_api_client.client import QCSClientConfiguration
+
+import pyquil.quantum_processor.qcs
 from pyquil.external.rpcq import make_edge_id
-from pyquil.quantum_processor import QCSQuantumProcessor
+from pyquil.quantum_processor import QCSQuantumProcessor, get_qcs_quantum_processor
 from pyquil.quantum_processor.transformers import qcs_isa_to_compiler_isa
 from pyquil.noise import NoiseModel
 from pyquil.external.rpcq import CompilerISA
@@ -39,3 +46,35 @@ def test_qcs_noise_model(qcs_aspen8_isa: InstructionSetArchitecture, noise_model
 
     assert isinstance(device.noise_model, NoiseModel)
     assert device.noise_model == noise_model
+
+
+@respx.mock
+def test_get_qcs_quantum_processor__reuses_recent_isa(
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    client_configuration: QCSClientConfiguration,
+    qcs_aspen8_isa: InstructionSetArchitecture,
+):
+    """
+    Test that ``get_qcs_quantum_processor`` only fetches the ISA again once the cached one expires,
+    or when a refresh is requested.
+    """
+    monkeypatch.setattr(pyquil.quantum_processor.qcs, "_isa_cache", {})
+    route = respx.get(
+        url=f"{client_configuration.profile.api_url}/v1/quantumProcessors/Aspen-8/instructionSetArchitecture",
+    ).respond(json=qcs_aspen8_isa.to_dict())
+    now = mocker.patch("pyquil.quantum_processor.qcs._now", return_value=1000.0)
+
+    first = get_qcs_quantum_processor("Aspen-8", client_configuration=client_configuration)
+    second = get_qcs_quantum_processor("Aspen-8", client_configuration=client_configuration)
+    assert route.call_count == 1
+    assert first is not second
+    assert first._isa is not second._isa
+    assert first.qubits() == second.qubits()
+
+    get_qcs_quantum_processor("Aspen-8", client_configuration=client_configuration, refresh=True)
+    assert route.call_count == 2
+
+    now.return_value = 2000.0
+    get_qcs_quantum_processor("Aspen-8", client_configuration=client_configuration)
+    assert route.call_count == 3
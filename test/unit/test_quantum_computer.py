@@ -30,8 +30,9 @@ from pyquil.gates import CNOT, MEASURE, RESET, RX, RY, H, I, X
 from pyquil.noise import NoiseModel, decoherence_noise_with_asymmetric_ro
 from pyquil.paulis import sX, sY, sZ
 from pyquil.pyqvm import PyQVM
-from pyquil.quantum_processor import NxQuantumProcessor
+from pyquil.quantum_processor import NxQuantumProcessor, QCSQuantumProcessor
 from pyquil.quilbase import Declare, MemoryReference
+from pytest_mock import MockerFixture
 from qcs_api_client.models.instruction_set_architecture import InstructionSetArchitecture
 from rpcq.messages import ParameterAref
 
@@ -849,3 +850,18 @@ def test_get_qc_endpoint_id(client_configuration: QCSClientConfiguration, qcs_as
     qc = get_qc("test", endpoint_id="test-endpoint")
 
     assert qc.qam._qpu_client._endpoint_id == "test-endpoint"
+
+
+def test_get_qc__refresh_isa(
+    mocker: MockerFixture, client_configuration: QCSClientConfiguration, qcs_aspen8_isa: InstructionSetArchitecture
+):
+    get_qcs_quantum_processor = mocker.patch(
+        "pyquil.api._quantum_computer.get_qcs_quantum_processor",
+        return_value=QCSQuantumProcessor("test", qcs_aspen8_isa),
+    )
+
+    get_qc("test", client_configuration=client_configuration, refresh_isa=True)
+
+    get_qcs_quantum_processor.assert_called_once_with(
+        quantum_processor_id="test", client_configuration=client_configuration, refresh=True
+    )
@@ -1109,6 +1109,23 @@ def test_declare():
     assert program.out() == ("DECLARE read_out BIT[5]\nMEASURE 0 read_out[4]\n")
 
 
+def test_prepend_instructions__tracks_declarations():
+    program = Program(Declare("ro", "BIT", 1), MEASURE(0, MemoryReference("ro", 0)))
+    theta = Declare("theta", "REAL", 1)
+    program.prepend_instructions([theta])
+    assert program.out() == "DECLARE theta REAL[1]\nDECLARE ro BIT[1]\nMEASURE 0 ro[0]\n"
+    assert list(program.declarations) == ["ro", "theta"]
+    assert program.declarations["theta"] is theta
+
+
+def test_pop__untracks_declarations():
+    program = Program(Declare("ro", "BIT", 1))
+    theta = Declare("theta", "REAL", 1)
+    program += theta
+    assert program.pop() is theta
+    assert list(program.declarations) == ["ro"]
+
+
 def test_reset():
     p = Program()
     p.reset(0)
@@ -1,12 +1,22 @@
 import numpy as np
 import pytest
+from pytest_mock import MockerFixture
 
+import pyquil.api._qvm
 from pyquil import Program
 from pyquil.api import QVM
 from pyquil.api._errors import QVMError
-from pyquil.api._qvm import validate_noise_probabilities, validate_qubit_list, prepare_register_list
+from pyquil.api._qvm import (
+    QVMVersionMismatch,
+    check_qvm_version,
+    prepare_register_list,
+    validate_noise_probabilities,
+    validate_qubit_list,
+)
+from pyquil.api._qvm_client import QVMClient, RunProgramResponse
 from pyquil.api import QCSClientConfiguration
-from pyquil.gates import MEASURE, X
+from pyquil.gates import MEASURE, RX, X
+from pyquil.noise import _decoherence_noise_model, _get_program_gates
 from pyquil.quilbase import Declare, MemoryReference
 
 
@@ -77,6 +87,40 @@ def test_qvm_run_region_not_declared_not_measured(client_configuration: QCSClien
     assert result.readout_data.get("ro") is None
 
 
+def test_qvm_run__result_dtypes(client_configuration: QCSClientConfiguration, mocker: MockerFixture):
+    mocker.patch.object(QVMClient, "get_version", return_value="1.17.1")
+    mocker.patch.object(
+        QVMClient,
+        "run_program",
+        return_value=RunProgramResponse(results={"ro": [[1], [0]], "theta": [[0], [0]]}),
+    )
+    qvm = QVM(client_configuration=client_configuration)
+    p = Program(Declare("ro", "BIT"), Declare("theta", "REAL"), X(0), MEASURE(0, MemoryReference("ro")))
+    result = qvm.run(p.wrap_in_numshots_loop(2))
+
+    assert result.readout_data["ro"].dtype == np.int64
+    assert result.readout_data["theta"].dtype == np.float64
+    np.testing.assert_array_equal(result.readout_data["ro"], [[1], [0]])
+
+
+def test_qvm_run__reuses_noise_model_header(client_configuration: QCSClientConfiguration, mocker: MockerFixture):
+    mocker.patch.object(QVMClient, "get_version", return_value="1.17.1")
+    run_program = mocker.patch.object(QVMClient, "run_program", return_value=RunProgramResponse(results={"ro": [[1]]}))
+    program_header = mocker.spy(pyquil.api._qvm, "noise_model_program_header")
+
+    p = Program(Declare("ro", "BIT"), RX(np.pi / 2, 0), MEASURE(0, MemoryReference("ro")))
+    noise_model = _decoherence_noise_model(_get_program_gates(Program(RX(np.pi / 2, 0))))
+    qvm = QVM(noise_model=noise_model, client_configuration=client_configuration)
+    qvm.run(p)
+    qvm.run(p)
+
+    assert program_header.call_count == 1
+    first, second = (call.args[0].program for call in run_program.call_args_list)
+    assert first == second
+    assert "PRAGMA READOUT-POVM 0" in first
+    assert "NOISY-RX-PLUS-90 0\nMEASURE 0 ro[0]\n" in first
+
+
 def test_qvm_version(client_configuration: QCSClientConfiguration):
     qvm = QVM(client_configuration=client_configuration)
     version = qvm.get_version_info()
@@ -92,6 +136,15 @@ def test_qvm_version(client_configuration: QCSClientConfiguration):
     assert is_a_version_string(version)
 
 
+def test_check_qvm_version():
+    check_qvm_version("1.17.1")
+    check_qvm_version("1.8.0")
+    with pytest.raises(QVMVersionMismatch):
+        check_qvm_version("1.7.2")
+    with pytest.raises(ValueError, match="Unable to parse QVM version"):
+        check_qvm_version("unknown")
+
+
 def test_validate_noise_probabilities():
     with pytest.raises(TypeError, match="noise_parameter must be a tuple"):
         validate_noise_probabilities(1)
@@ -113,8 +166,26 @@ def test_validate_qubit_list():
         validate_qubit_list([-1, 1])
     with pytest.raises(TypeError):
         validate_qubit_list(["a", 0], 1)
+    with pytest.raises(TypeError):
+        validate_qubit_list(np.array([-1, 1]))
+    with pytest.raises(TypeError):
+        validate_qubit_list(np.array([0.0, 1.0]))
+
+    qubits = validate_qubit_list(np.array([0, 2, 1]))
+    assert qubits == [0, 2, 1]
+    assert all(type(q) is int for q in qubits)
 
 
 def test_prepare_register_list():
     with pytest.raises(TypeError):
         prepare_register_list({"ro": [-1, 1]})
+    with pytest.raises(TypeError):
+        prepare_register_list({"ro": np.array([-1, 1])})
+    with pytest.raises(TypeError):
+        prepare_register_list({"ro": range(3, -2, -1)})
+
+    assert prepare_register_list({"ro": range(4, 0, -2), "empty": range(-1, -3)}) == {"ro": [4, 2], "empty": []}
+
+    registers = prepare_register_list({"ro": np.array([0, 2]), "theta": np.array([1.0]), "beta": range(2), "a": True})
+    assert registers == {"ro": [0, 2], "theta": [1], "beta": [0, 1], "a": True}
+    assert all(type(i) is int for i in registers["ro"] + registers["theta"])
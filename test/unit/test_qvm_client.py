@@ -14,12 +14,16 @@
 #    limitations under the License.
 ##############################################################################
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 import httpx
+import numpy as np
+import pytest
 import respx
 from qcs_api_client.client import QCSClientConfiguration
 
+from pyquil.api._errors import TooManyQubitsError, UnknownApiError
 from pyquil.api._qvm_client import (
     QVMClient,
     GetWavefunctionResponse,
@@ -30,6 +34,8 @@ from pyquil.api._qvm_client import (
     RunAndMeasureProgramRequest,
     RunProgramRequest,
     RunProgramResponse,
+    _json_default,
+    json_dumps,
 )
 
 
@@ -44,12 +50,39 @@ def test_init__sets_base_url_and_timeout(client_configuration: QCSClientConfigur
 def test_get_version__returns_version(client_configuration: QCSClientConfiguration):
     qvm_client = QVMClient(client_configuration=client_configuration)
 
-    respx.post(
+    route = respx.post(
         url=client_configuration.profile.applications.pyquil.qvm_url,
         json={"type": "version"},
     ).respond(status_code=200, text="1.2.3 [abc123]")
 
     assert qvm_client.get_version() == "1.2.3"
+    # Every call asks the server, so that QVM.connect() notices a stopped or restarted QVM
+    assert qvm_client.get_version() == "1.2.3"
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_requests__reuse_http_client_until_closed(client_configuration: QCSClientConfiguration):
+    respx.post(
+        url=client_configuration.profile.applications.pyquil.qvm_url,
+        json={"type": "version"},
+    ).respond(status_code=200, text="1.2.3 [abc123]")
+
+    with QVMClient(client_configuration=client_configuration) as qvm_client:
+        qvm_client.get_version()
+        http_client = qvm_client._http_client()
+        qvm_client.get_version()
+        assert qvm_client._http_client() is http_client
+
+    assert qvm_client._http is None
+
+
+def test_http_client__created_once_across_threads(client_configuration: QCSClientConfiguration):
+    with QVMClient(client_configuration=client_configuration) as qvm_client:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            http_clients = list(executor.map(lambda _: qvm_client._http_client(), range(32)))
+
+        assert all(http_client is http_clients[0] for http_client in http_clients)
 
 
 @respx.mock
@@ -155,3 +188,57 @@ def test_get_wavefunction__returns_wavefunction(client_configuration: QCSClientC
         seed=314,
     )
     assert qvm_client.get_wavefunction(request) == GetWavefunctionResponse(wavefunction=b"some-wavefunction")
+
+
+@respx.mock
+def test_run_program__raises_too_many_qubits_error(client_configuration: QCSClientConfiguration):
+    qvm_client = QVMClient(client_configuration=client_configuration)
+
+    respx.post(url=client_configuration.profile.applications.pyquil.qvm_url).respond(
+        status_code=400,
+        json={
+            "error_type": "qvm_error",
+            "status": "40 qubits were requested, but the QVM is limited to 30 qubits.",
+        },
+    )
+
+    request = RunProgramRequest(
+        program="some-program",
+        addresses={"ro": True},
+        trials=1,
+        measurement_noise=None,
+        gate_noise=None,
+        seed=None,
+    )
+    with pytest.raises(TooManyQubitsError):
+        qvm_client.run_program(request)
+
+
+@respx.mock
+def test_run_program__raises_unknown_api_error_for_non_json_body(client_configuration: QCSClientConfiguration):
+    qvm_client = QVMClient(client_configuration=client_configuration)
+
+    respx.post(url=client_configuration.profile.applications.pyquil.qvm_url).respond(
+        status_code=500, text="Internal Server Error"
+    )
+
+    request = RunProgramRequest(
+        program="some-program",
+        addresses={"ro": True},
+        trials=1,
+        measurement_noise=None,
+        gate_noise=None,
+        seed=None,
+    )
+    with pytest.raises(UnknownApiError, match="Internal Server Error"):
+        qvm_client.run_program(request)
+
+
+def test_json_dumps__serializes_numpy_values():
+    payload = {"addresses": {"ro": np.array([0, 1])}, "trials": np.int64(3)}
+
+    assert json.loads(json_dumps(payload)) == {"addresses": {"ro": [0, 1]}, "trials": 3}
+    # The stdlib fallback serializes numpy values the same way
+    assert json.loads(json.dumps(payload, default=_json_default)) == {"addresses": {"ro": [0, 1]}, "trials": 3}
+    with pytest.raises(TypeError):
+        json.dumps({"program": object()}, default=_json_default)
@@ -15,6 +15,16 @@ def test_rewrite_arithmetic_no_params():
     assert response == RewriteArithmeticResponse(quil=Program("X 0").out())
 
 
+def test_rewrite_arithmetic_constant_params():
+    fdefn = DefFrame(frame=Frame([Qubit(0)], "rf"), sample_rate=20.0)
+    prog = Program(fdefn, "DECLARE ro BIT", "RX(pi/2) 0", 'SET-PHASE 0 "rf" 1.0', "MEASURE 0 ro[0]")
+    response = rewrite_arithmetic(prog)
+    assert response == RewriteArithmeticResponse(
+        original_memory_descriptors={"ro": ParameterSpec(length=1, type="BIT")},
+        quil=prog.out(),
+    )
+
+
 def test_rewrite_arithmetic_simple_mref():
     prog = Program("DECLARE theta REAL", "RZ(theta) 0")
     response = rewrite_arithmetic(prog)
@@ -1,11 +1,14 @@
 import numpy as np
 import pytest
+from pytest_mock import MockerFixture
 
 from pyquil import Program
 from pyquil.api import WavefunctionSimulator
 from pyquil.api import QCSClientConfiguration
-from pyquil.gates import H, CNOT
+from pyquil.api._qvm_client import MeasureExpectationResponse, QVMClient
+from pyquil.gates import H, CNOT, MEASURE, RX
 from pyquil.paulis import PauliSum, sZ, sX
+from pyquil.quilatom import MemoryReference
 
 def test_wavefunction(client_configuration: QCSClientConfiguration):
     wfnsim = WavefunctionSimulator(client_configuration=client_configuration)
@@ -58,6 +61,28 @@ def test_expectation(client_configuration: QCSClientConfiguration):
     np.testing.assert_allclose(expects, [1])
 
 
+def test_expectation__pauli_sum(client_configuration: QCSClientConfiguration, mocker: MockerFixture):
+    mocker.patch.object(
+        QVMClient, "measure_expectation", return_value=MeasureExpectationResponse(expectations=[1.0, 0.5, -1.0])
+    )
+    wfnsim = WavefunctionSimulator(client_configuration=client_configuration)
+    pauli_sum = 2.0 * sZ(0) + 0.5 * sX(0) + sZ(1)
+
+    assert wfnsim.expectation(Program(H(0)), pauli_sum) == pytest.approx(2.0 + 0.25 - 1.0)
+    np.testing.assert_allclose(wfnsim.expectation(Program(H(0)), pauli_sum.terms), [2.0, 0.25, -1.0])
+
+
+def test_expectation_request__serializes_operator_programs(client_configuration: QCSClientConfiguration):
+    wfnsim = WavefunctionSimulator(client_configuration=client_configuration)
+    zz = (sZ(0) * sZ(1)).program
+    request = wfnsim._expectation_request(
+        prep_prog=Program(H(0)),
+        operator_programs=(p for p in [zz, sX(0).program, zz]),
+    )
+    assert request.prep_program == "H 0\n"
+    assert request.pauli_operators == ["Z 0\nZ 1\n", "X 0\n", "Z 0\nZ 1\n"]
+
+
 def test_run_and_measure(client_configuration: QCSClientConfiguration):
     wfnsim = WavefunctionSimulator(client_configuration=client_configuration)
     bell = Program(H(0), CNOT(0, 1))
@@ -72,3 +97,24 @@ def test_run_and_measure_qubits(client_configuration: QCSClientConfiguration):
     bitstrings = wfnsim.run_and_measure(bell, qubits=[0, 100], trials=1000)
     assert np.all(bitstrings[:, 1] == 0)
     assert 0.4 < np.mean(bitstrings[:, 0]) < 0.6
+
+
+def test_augment_program_with_memory_values():
+    p = Program(H(0))
+    p.declare("theta", "REAL", 2)
+    p += RX(MemoryReference("theta"), 0)
+    ro = p.declare("ro", "BIT", 1)
+    p += MEASURE(0, ro[0])
+
+    augmented = WavefunctionSimulator.augment_program_with_memory_values(p, {"theta": [0.5, 1.5]})
+
+    assert augmented.out() == (
+        "DECLARE theta REAL[2]\n"
+        "DECLARE ro BIT[1]\n"
+        "MOVE theta[0] 0.5\n"
+        "MOVE theta[1] 1.5\n"
+        "H 0\n"
+        "RX(theta[0]) 0\n"
+        "MEASURE 0 ro[0]\n"
+    )
+    assert WavefunctionSimulator.augment_program_with_memory_values(p, {}) is p